@@ -0,0 +1,44 @@
+"""
+Event loop selection shared by the example entrypoints.
+
+Both loops are optional: each is used only when its package is installed,
+and the stock asyncio loop is kept otherwise.
+"""
+
+import asyncio
+import platform
+import sys
+
+
+def _kernel_supports_io_uring() -> bool:
+    """Check for a Linux kernel new enough (5.11+) for uringcore."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        major, minor = platform.release().split(".")[:2]
+        return (int(major), int(minor)) >= (5, 11)
+    except ValueError:
+        return False
+
+
+def install_event_loop_policy(prefer_io_uring: bool = False) -> None:
+    """
+    Install a faster event loop policy before asyncio.run().
+
+    Args:
+        prefer_io_uring: Try uringcore's io_uring loop first on Linux
+    """
+    if prefer_io_uring and _kernel_supports_io_uring():
+        try:
+            import uringcore
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+            return
+        except ImportError:
+            pass
+
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
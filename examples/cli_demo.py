@@ -10,23 +10,16 @@ Run:
 """
 
 import asyncio
-from agentui.bridge import CLIBridge, TUIConfig
-from agentui.primitives import (
-    UIForm,
-    UIProgress,
-    UIProgressStep,
-    UITable,
-    UICode,
-    UIConfirm,
-    UISelect,
-    text_field,
-    select_field,
-    checkbox_field,
-)
+
+# Banner rule, built once instead of on every section header
+_SEP50 = "=" * 50
 
 
 async def demo_cli_elements():
     """Demonstrate CLI fallback rendering."""
+    from agentui.bridge import CLIBridge, TUIConfig
+    from agentui.primitives import checkbox_field, select_field, text_field
+
     config = TUIConfig(
         app_name="CLI Demo",
         tagline="Testing Rich fallback",
@@ -35,9 +28,9 @@ async def demo_cli_elements():
     bridge = CLIBridge(config)
     await bridge.start()
     
-    print("\n" + "=" * 50)
+    print("\n" + _SEP50)
     print("1. Text & Markdown")
-    print("=" * 50)
+    print(_SEP50)
     
     await bridge.send_text("Hello! This is streaming text...")
     await bridge.send_text(" and more text", done=True)
@@ -58,9 +51,9 @@ def hello():
 ```
 """)
     
-    print("\n" + "=" * 50)
+    print("\n" + _SEP50)
     print("2. Tables")
-    print("=" * 50 + "\n")
+    print(_SEP50 + "\n")
     
     await bridge.send_table(
         columns=["Service", "Cost", "Status"],
@@ -72,9 +65,9 @@ def hello():
         title="Cloud Costs",
     )
     
-    print("\n" + "=" * 50)
+    print("\n" + _SEP50)
     print("3. Code Blocks")
-    print("=" * 50 + "\n")
+    print(_SEP50 + "\n")
     
     await bridge.send_code(
         code='''async def main():
@@ -87,34 +80,34 @@ def hello():
         title="example.py",
     )
     
-    print("\n" + "=" * 50)
+    print("\n" + _SEP50)
     print("4. Progress")
-    print("=" * 50 + "\n")
+    print(_SEP50 + "\n")
     
     await bridge.send_progress(
         message="Processing...",
         percent=75,
     )
     
-    print("\n" + "=" * 50)
+    print("\n" + _SEP50)
     print("5. Alerts")
-    print("=" * 50 + "\n")
+    print(_SEP50 + "\n")
     
     await bridge.send_alert("This is an info alert", severity="info")
     await bridge.send_alert("Operation successful!", severity="success")
     await bridge.send_alert("Warning: check configuration", severity="warning")
     await bridge.send_alert("Error: connection failed", severity="error")
     
-    print("\n" + "=" * 50)
+    print("\n" + _SEP50)
     print("6. Forms (Interactive)")
-    print("=" * 50 + "\n")
+    print(_SEP50 + "\n")
     
     # Form demo
     form_result = await bridge.request_form(
         fields=[
-            text_field("name", "Project Name").to_dict(),
-            select_field("language", "Language", ["Python", "Go", "Rust"]).to_dict(),
-            checkbox_field("docker", "Include Docker").to_dict(),
+            text_field("name", "Project Name"),
+            select_field("language", "Language", ["Python", "Go", "Rust"]),
+            checkbox_field("docker", "Include Docker"),
         ],
         title="Project Setup",
         description="Configure your new project",
@@ -123,9 +116,9 @@ def hello():
     if form_result:
         print(f"\nForm submitted: {form_result}")
     
-    print("\n" + "=" * 50)
+    print("\n" + _SEP50)
     print("7. Confirmation (Interactive)")
-    print("=" * 50 + "\n")
+    print(_SEP50 + "\n")
     
     confirmed = await bridge.request_confirm(
         "Deploy to production?",
@@ -133,9 +126,9 @@ def hello():
     )
     print(f"Confirmed: {confirmed}")
     
-    print("\n" + "=" * 50)
+    print("\n" + _SEP50)
     print("8. Selection (Interactive)")
-    print("=" * 50 + "\n")
+    print(_SEP50 + "\n")
     
     selected = await bridge.request_select(
         "Choose your theme:",
@@ -143,12 +136,15 @@ def hello():
     )
     print(f"Selected: {selected}")
     
-    print("\n" + "=" * 50)
+    print("\n" + _SEP50)
     print("Demo Complete!")
-    print("=" * 50)
+    print(_SEP50)
     
     await bridge.stop()
 
 
 if __name__ == "__main__":
+    from _event_loop import install_event_loop_policy
+
+    install_event_loop_policy()
     asyncio.run(demo_cli_elements())
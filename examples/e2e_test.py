@@ -21,7 +21,7 @@ import logging
 from pathlib import Path
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 from agentui.bridge import TUIBridge, TUIConfig, BridgeError
 from agentui.protocol import MessageType
@@ -32,6 +32,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Banner rules, built once instead of on every print
+_SEP60 = "=" * 60
+_SEP40 = "=" * 40
+
+# Markdown body for the basic communication test
+_TEST_MD = """
+## Test Markdown
+
+This is a **bold** test with:
+- Bullet 1
+- Bullet 2
+- Bullet 3
+
+```python
+print("Hello, World!")
+```
+"""
+
+# Table rows and progress steps for the basic communication test
+_TEST_ROWS: tuple[tuple[str, str, str], ...] = (
+    ("Test 1", "100", "✓"),
+    ("Test 2", "200", "✓"),
+    ("Test 3", "300", "✓"),
+)
+_TEST_STEPS = (
+    {"label": "Initialize", "status": "complete"},
+    {"label": "Send messages", "status": "complete"},
+    {"label": "Test forms", "status": "running"},
+    {"label": "Cleanup", "status": "pending"},
+)
+
+# Chat inputs that end the chat loop test (compared lower-cased)
+_QUIT_WORDS = frozenset(("quit", "exit"))
+
+# Fields for the interactive form test, built once at import time
+_TEST_FORM_FIELDS = (
+    {"name": "name", "label": "Your Name", "type": "text", "required": True},
+    {"name": "language", "label": "Favorite Language", "type": "select",
+     "options": ["Python", "Go", "Rust", "TypeScript"]},
+    {"name": "agree", "label": "I agree to the terms", "type": "checkbox"},
+)
+
 
 async def test_basic_communication():
     """Test basic message sending."""
@@ -54,47 +96,23 @@ async def test_basic_communication():
         await bridge.send_status("Testing connection...")
         logger.info("✓ Sent status message")
         
-        await asyncio.sleep(0.5)
-        
         # Send text
-        await bridge.send_text("Hello from Python! ", done=False)
-        await bridge.send_text("This is streaming text.", done=True)
-        logger.info("✓ Sent text messages")
-        
-        await asyncio.sleep(0.5)
+        await bridge.send_text("Hello from Python! This is streaming text.", done=True)
+        logger.info("✓ Sent text message")
         
         # Send markdown
-        await bridge.send_markdown("""
-## Test Markdown
-
-This is a **bold** test with:
-- Bullet 1
-- Bullet 2
-- Bullet 3
-
-```python
-print("Hello, World!")
-```
-""", title="Markdown Test")
+        await bridge.send_markdown(_TEST_MD, title="Markdown Test")
         logger.info("✓ Sent markdown")
         
-        await asyncio.sleep(0.5)
-        
         # Send table
         await bridge.send_table(
             columns=["Name", "Value", "Status"],
-            rows=[
-                ["Test 1", "100", "✓"],
-                ["Test 2", "200", "✓"],
-                ["Test 3", "300", "✓"],
-            ],
+            rows=_TEST_ROWS,
             title="Test Table",
             footer="All tests passed!"
         )
         logger.info("✓ Sent table")
         
-        await asyncio.sleep(0.5)
-        
         # Send code
         await bridge.send_code(
             code='''async def main():
@@ -107,32 +125,28 @@ print("Hello, World!")
         )
         logger.info("✓ Sent code block")
         
-        await asyncio.sleep(0.5)
-        
         # Send progress
         await bridge.send_progress(
             message="Running tests...",
             percent=75,
-            steps=[
-                {"label": "Initialize", "status": "complete"},
-                {"label": "Send messages", "status": "complete"},
-                {"label": "Test forms", "status": "running"},
-                {"label": "Cleanup", "status": "pending"},
-            ]
+            steps=_TEST_STEPS,
         )
         logger.info("✓ Sent progress")
         
-        await asyncio.sleep(0.5)
-        
         # Send alerts
-        await bridge.send_alert("Information message", severity="info")
-        await bridge.send_alert("Success message", severity="success")
-        await bridge.send_alert("Warning message", severity="warning")
-        await bridge.send_alert("Error message", severity="error")
+        alerts = (
+            ("Information message", "info"),
+            ("Success message", "success"),
+            ("Warning message", "warning"),
+            ("Error message", "error"),
+        )
+        # Tasks start in creation order, so the alerts still reach the
+        # batch (and the wire) in the order listed above.
+        async with bridge.batch(), asyncio.TaskGroup() as tg:
+            for message, severity in alerts:
+                tg.create_task(bridge.send_alert(message, severity=severity))
         logger.info("✓ Sent alerts")
         
-        await asyncio.sleep(1)
-        
         # Done
         await bridge.send_done("Test completed successfully!")
         logger.info("✓ Sent done")
@@ -142,8 +156,8 @@ print("Hello, World!")
     except BridgeError as e:
         logger.error(f"✗ Bridge error: {e}")
         return False
-    except Exception as e:
-        logger.error(f"✗ Unexpected error: {e}")
+    except Exception:
+        logger.exception("✗ Unexpected error")
         return False
     finally:
         await bridge.stop()
@@ -173,12 +187,7 @@ async def test_interactive_forms():
         # Request form
         logger.info("Requesting form...")
         result = await bridge.request_form(
-            fields=[
-                {"name": "name", "label": "Your Name", "type": "text", "required": True},
-                {"name": "language", "label": "Favorite Language", "type": "select", 
-                 "options": ["Python", "Go", "Rust", "TypeScript"]},
-                {"name": "agree", "label": "I agree to the terms", "type": "checkbox"},
-            ],
+            fields=_TEST_FORM_FIELDS,
             title="Test Form",
             description="Please fill in this form to test the communication.",
         )
@@ -220,10 +229,8 @@ async def test_interactive_forms():
     except BridgeError as e:
         logger.error(f"✗ Bridge error: {e}")
         return False
-    except Exception as e:
-        logger.error(f"✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("✗ Unexpected error")
         return False
     finally:
         await bridge.stop()
@@ -257,13 +264,13 @@ async def test_chat_loop():
         max_messages = 5
         
         async for event in bridge.events():
-            logger.info(f"Received event: {event.type}")
+            logger.info("Received event: %s", event.type)
             
             if event.type == MessageType.INPUT.value:
                 content = event.payload.get("content", "")
                 message_count += 1
                 
-                if content.lower() == "quit":
+                if content.strip().lower() in _QUIT_WORDS:
                     await bridge.send_text("Goodbye!", done=True)
                     break
                 
@@ -293,10 +300,8 @@ async def test_chat_loop():
     except BridgeError as e:
         logger.error(f"✗ Bridge error: {e}")
         return False
-    except Exception as e:
-        logger.error(f"✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("✗ Unexpected error")
         return False
     finally:
         await bridge.stop()
@@ -306,20 +311,20 @@ async def test_chat_loop():
 
 async def main():
     """Run all tests."""
-    print("=" * 60)
+    print(_SEP60)
     print("AgentUI End-to-End Tests")
-    print("=" * 60)
+    print(_SEP60)
     print()
     print("These tests require the Go TUI to be built:")
     print("  make build-tui")
     print()
     print("Tests will run interactively - follow the prompts.")
-    print("=" * 60)
+    print(_SEP60)
     print()
     
     # Check if TUI binary exists
-    tui_path = Path(__file__).parent.parent / "bin" / "agentui-tui"
-    if not tui_path.exists():
+    tui_path = Path(__file__).resolve().parent.parent / "bin" / "agentui-tui"
+    if not tui_path.is_file():
         print(f"ERROR: TUI binary not found at {tui_path}")
         print("Please run 'make build-tui' first.")
         return 1
@@ -330,34 +335,33 @@ async def main():
         ("Chat Loop", test_chat_loop),
     ]
     
-    results = []
+    results: dict[str, bool] = {}
     
     for name, test_func in tests:
-        print(f"\n{'=' * 40}")
+        print("\n" + _SEP40)
         print(f"Running: {name}")
-        print("=" * 40)
+        print(_SEP40)
         
         try:
-            result = await test_func()
-            results.append((name, result))
+            results[name] = await test_func()
         except KeyboardInterrupt:
             print("\nTest interrupted by user")
-            results.append((name, False))
+            results[name] = False
             break
         except Exception as e:
             print(f"\nTest failed with exception: {e}")
-            results.append((name, False))
+            results[name] = False
     
     # Summary
-    print("\n" + "=" * 60)
+    print("\n" + _SEP60)
     print("Test Summary")
-    print("=" * 60)
+    print(_SEP60)
     
-    for name, result in results:
+    for name, result in results.items():
         status = "✓ PASS" if result else "✗ FAIL"
         print(f"  {status}: {name}")
     
-    passed = sum(1 for _, r in results if r)
+    passed = sum(results.values())
     total = len(results)
     print(f"\n  Total: {passed}/{total} passed")
     
@@ -365,4 +369,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    from _event_loop import install_event_loop_policy
+
+    install_event_loop_policy(prefer_io_uring=True)
     sys.exit(asyncio.run(main()))
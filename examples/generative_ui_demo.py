@@ -24,6 +24,169 @@ from agentui import (
 from agentui.primitives import text_field, select_field, checkbox_field
 
 
+# Tool responses are static, so build them once at import time instead of
+# on every tool call.
+
+_TECH_OPTIONS = {
+    "web": ["React", "Vue", "Svelte", "HTMX"],
+    "api": ["FastAPI", "Express", "Go Gin", "Rails"],
+    "cli": ["Python", "Go", "Rust", "Node"],
+}
+_DEFAULT_TECH_OPTIONS = ["Python", "Go", "Node"]
+
+_PROGRESS_STEPS = {
+    "deployment": [
+        UIProgressStep("Build", "complete", "Compiled in 2.3s"),
+        UIProgressStep("Test", "complete", "42 tests passed"),
+        UIProgressStep("Deploy", "running", "Uploading to production..."),
+        UIProgressStep("Verify", "pending"),
+    ],
+    "research": [
+        UIProgressStep("Market Analysis", "complete"),
+        UIProgressStep("Competitor Review", "complete"),
+        UIProgressStep("Architecture Design", "running"),
+        UIProgressStep("Cost Estimation", "pending"),
+        UIProgressStep("Sprint Planning", "pending"),
+    ],
+}
+_DEFAULT_PROGRESS_STEPS = [
+    UIProgressStep("Step 1", "complete"),
+    UIProgressStep("Step 2", "running"),
+    UIProgressStep("Step 3", "pending"),
+]
+
+_TABLES = {
+    "costs": UITable(
+        title="Monthly Cloud Costs",
+        columns=["Service", "Tier", "Monthly Cost", "Annual"],
+        rows=[
+            ["EC2", "t3.medium", "$30.00", "$360"],
+            ["RDS", "db.t3.small", "$25.00", "$300"],
+            ["S3", "Standard", "$5.00", "$60"],
+            ["Lambda", "1M requests", "$2.00", "$24"],
+            ["CloudFront", "100GB", "$8.50", "$102"],
+        ],
+        footer="Total: $70.50/month · $846/year",
+    ),
+    "metrics": UITable(
+        title="Application Metrics",
+        columns=["Metric", "Current", "Target", "Status"],
+        rows=[
+            ["Response Time", "45ms", "<100ms", "✓"],
+            ["Error Rate", "0.1%", "<1%", "✓"],
+            ["Uptime", "99.9%", "99.5%", "✓"],
+            ["Throughput", "1.2k/s", "1k/s", "✓"],
+        ],
+    ),
+    "comparison": UITable(
+        title="Framework Comparison",
+        columns=["Feature", "React", "Vue", "Svelte"],
+        rows=[
+            ["Learning Curve", "Medium", "Easy", "Easy"],
+            ["Performance", "Good", "Good", "Excellent"],
+            ["Bundle Size", "Large", "Medium", "Small"],
+            ["Ecosystem", "Huge", "Large", "Growing"],
+            ["TypeScript", "Excellent", "Good", "Good"],
+        ],
+    ),
+}
+
+_PY_EXAMPLE = '''from fastapi import FastAPI
+
+app = FastAPI()
+
+@app.get("/")
+async def root():
+    return {"message": "Hello World"}
+
+@app.get("/items/{item_id}")
+async def read_item(item_id: int, q: str = None):
+    return {"item_id": item_id, "q": q}'''
+
+_GO_EXAMPLE = '''package main
+
+import (
+    "fmt"
+    "net/http"
+)
+
+func main() {
+    http.HandleFunc("/", func(w http.ResponseWriter, r *http.Request) {
+        fmt.Fprintf(w, "Hello, World!")
+    })
+    
+    http.ListenAndServe(":8080", nil)
+}'''
+
+_TS_EXAMPLE = '''interface Props {
+  name: string;
+  count: number;
+}
+
+export function Counter({ name, count }: Props) {
+  const [value, setValue] = useState(count);
+  
+  return (
+    <div className="counter">
+      <h2>{name}</h2>
+      <button onClick={() => setValue(v => v + 1)}>
+        Count: {value}
+      </button>
+    </div>
+  );
+}'''
+
+_CODE_EXAMPLES = {
+    "python": UICode(
+        title="FastAPI Example",
+        language="python",
+        code=_PY_EXAMPLE,
+    ),
+    "go": UICode(
+        title="Go HTTP Server",
+        language="go",
+        code=_GO_EXAMPLE,
+    ),
+    "typescript": UICode(
+        title="React Component",
+        language="typescript",
+        code=_TS_EXAMPLE,
+    ),
+}
+
+_CONFIRM_MESSAGES = {
+    "deploy": "Deploy to production? This will affect live users.",
+    "delete": "Delete this project? This action cannot be undone.",
+    "reset": "Reset all settings to defaults?",
+}
+
+_SELECT_OPTIONS = {
+    "theme": UISelect(
+        label="Select Theme",
+        options=[
+            "Catppuccin Mocha",
+            "Catppuccin Latte",
+            "Dracula",
+            "Nord",
+            "Tokyo Night",
+        ],
+        default="Catppuccin Mocha",
+    ),
+    "model": UISelect(
+        label="Select AI Model",
+        options=[
+            "Claude Opus 4.5",
+            "Claude Sonnet 4.5",
+            "GPT-4o",
+            "Gemini Pro",
+        ],
+    ),
+    "provider": UISelect(
+        label="Select Cloud Provider",
+        options=["AWS", "Google Cloud", "Azure", "DigitalOcean"],
+    ),
+}
+
 app = AgentApp(
     name="ui-demo",
     provider="claude",
@@ -59,12 +222,8 @@ Be creative and show off the beautiful interfaces!""",
 )
 def show_project_form(project_type: str = "web") -> UIForm:
     """Return a form for project configuration."""
-    tech_options = {
-        "web": ["React", "Vue", "Svelte", "HTMX"],
-        "api": ["FastAPI", "Express", "Go Gin", "Rails"],
-        "cli": ["Python", "Go", "Rust", "Node"],
-    }.get(project_type, ["Python", "Go", "Node"])
-    
+    tech_options = _TECH_OPTIONS.get(project_type, _DEFAULT_TECH_OPTIONS)
+
     return UIForm(
         title=f"Configure {project_type.title()} Project",
         description="Fill in the details for your new project.",
@@ -95,27 +254,7 @@ def show_project_form(project_type: str = "web") -> UIForm:
 )
 def show_progress(task: str = "deployment") -> UIProgress:
     """Return a progress indicator."""
-    steps_by_task = {
-        "deployment": [
-            UIProgressStep("Build", "complete", "Compiled in 2.3s"),
-            UIProgressStep("Test", "complete", "42 tests passed"),
-            UIProgressStep("Deploy", "running", "Uploading to production..."),
-            UIProgressStep("Verify", "pending"),
-        ],
-        "research": [
-            UIProgressStep("Market Analysis", "complete"),
-            UIProgressStep("Competitor Review", "complete"),
-            UIProgressStep("Architecture Design", "running"),
-            UIProgressStep("Cost Estimation", "pending"),
-            UIProgressStep("Sprint Planning", "pending"),
-        ],
-    }
-    
-    steps = steps_by_task.get(task, [
-        UIProgressStep("Step 1", "complete"),
-        UIProgressStep("Step 2", "running"),
-        UIProgressStep("Step 3", "pending"),
-    ])
+    steps = _PROGRESS_STEPS.get(task, _DEFAULT_PROGRESS_STEPS)
     
     return UIProgress(
         message=f"Running {task}...",
@@ -139,43 +278,7 @@ def show_progress(task: str = "deployment") -> UIProgress:
 )
 def show_data_table(data_type: str = "costs") -> UITable:
     """Return a data table."""
-    tables = {
-        "costs": UITable(
-            title="Monthly Cloud Costs",
-            columns=["Service", "Tier", "Monthly Cost", "Annual"],
-            rows=[
-                ["EC2", "t3.medium", "$30.00", "$360"],
-                ["RDS", "db.t3.small", "$25.00", "$300"],
-                ["S3", "Standard", "$5.00", "$60"],
-                ["Lambda", "1M requests", "$2.00", "$24"],
-                ["CloudFront", "100GB", "$8.50", "$102"],
-            ],
-            footer="Total: $70.50/month · $846/year",
-        ),
-        "metrics": UITable(
-            title="Application Metrics",
-            columns=["Metric", "Current", "Target", "Status"],
-            rows=[
-                ["Response Time", "45ms", "<100ms", "✓"],
-                ["Error Rate", "0.1%", "<1%", "✓"],
-                ["Uptime", "99.9%", "99.5%", "✓"],
-                ["Throughput", "1.2k/s", "1k/s", "✓"],
-            ],
-        ),
-        "comparison": UITable(
-            title="Framework Comparison",
-            columns=["Feature", "React", "Vue", "Svelte"],
-            rows=[
-                ["Learning Curve", "Medium", "Easy", "Easy"],
-                ["Performance", "Good", "Good", "Excellent"],
-                ["Bundle Size", "Large", "Medium", "Small"],
-                ["Ecosystem", "Huge", "Large", "Growing"],
-                ["TypeScript", "Excellent", "Good", "Good"],
-            ],
-        ),
-    }
-    
-    return tables.get(data_type, tables["costs"])
+    return _TABLES.get(data_type, _TABLES["costs"])
 
 
 @app.ui_tool(
@@ -193,64 +296,7 @@ def show_data_table(data_type: str = "costs") -> UITable:
 )
 def show_code_example(language: str = "python") -> UICode:
     """Return a code block."""
-    examples = {
-        "python": UICode(
-            title="FastAPI Example",
-            language="python",
-            code='''from fastapi import FastAPI
-
-app = FastAPI()
-
-@app.get("/")
-async def root():
-    return {"message": "Hello World"}
-
-@app.get("/items/{item_id}")
-async def read_item(item_id: int, q: str = None):
-    return {"item_id": item_id, "q": q}''',
-        ),
-        "go": UICode(
-            title="Go HTTP Server",
-            language="go",
-            code='''package main
-
-import (
-    "fmt"
-    "net/http"
-)
-
-func main() {
-    http.HandleFunc("/", func(w http.ResponseWriter, r *http.Request) {
-        fmt.Fprintf(w, "Hello, World!")
-    })
-    
-    http.ListenAndServe(":8080", nil)
-}''',
-        ),
-        "typescript": UICode(
-            title="React Component",
-            language="typescript",
-            code='''interface Props {
-  name: string;
-  count: number;
-}
-
-export function Counter({ name, count }: Props) {
-  const [value, setValue] = useState(count);
-  
-  return (
-    <div className="counter">
-      <h2>{name}</h2>
-      <button onClick={() => setValue(v => v + 1)}>
-        Count: {value}
-      </button>
-    </div>
-  );
-}''',
-        ),
-    }
-    
-    return examples.get(language, examples["python"])
+    return _CODE_EXAMPLES.get(language, _CODE_EXAMPLES["python"])
 
 
 @app.ui_tool(
@@ -272,15 +318,9 @@ export function Counter({ name, count }: Props) {
 )
 def confirm_action(action: str = "deploy", destructive: bool = False) -> UIConfirm:
     """Return a confirmation dialog."""
-    messages = {
-        "deploy": "Deploy to production? This will affect live users.",
-        "delete": "Delete this project? This action cannot be undone.",
-        "reset": "Reset all settings to defaults?",
-    }
-    
     return UIConfirm(
         title="Confirm Action",
-        message=messages.get(action, f"Proceed with {action}?"),
+        message=_CONFIRM_MESSAGES.get(action, f"Proceed with {action}?"),
         confirm_label="Yes, proceed",
         cancel_label="Cancel",
         destructive=destructive or action == "delete",
@@ -302,34 +342,7 @@ def confirm_action(action: str = "deploy", destructive: bool = False) -> UIConfi
 )
 def select_option(category: str = "theme") -> UISelect:
     """Return a selection menu."""
-    options = {
-        "theme": UISelect(
-            label="Select Theme",
-            options=[
-                "Catppuccin Mocha",
-                "Catppuccin Latte",
-                "Dracula",
-                "Nord",
-                "Tokyo Night",
-            ],
-            default="Catppuccin Mocha",
-        ),
-        "model": UISelect(
-            label="Select AI Model",
-            options=[
-                "Claude Opus 4.5",
-                "Claude Sonnet 4.5",
-                "GPT-4o",
-                "Gemini Pro",
-            ],
-        ),
-        "provider": UISelect(
-            label="Select Cloud Provider",
-            options=["AWS", "Google Cloud", "Azure", "DigitalOcean"],
-        ),
-    }
-    
-    return options.get(category, options["theme"])
+    return _SELECT_OPTIONS.get(category, _SELECT_OPTIONS["theme"])
 
 
 async def main():
@@ -348,4 +361,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    from _event_loop import install_event_loop_policy
+
+    install_event_loop_policy()
     asyncio.run(main())
@@ -90,4 +90,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    from _event_loop import install_event_loop_policy
+
+    install_event_loop_policy()
     asyncio.run(main())
@@ -9,11 +9,14 @@ Run:
 """
 
 import asyncio
+import importlib.util
 import sys
+import traceback
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path when agentui is not installed (e.g. via pip install -e .)
+if importlib.util.find_spec("agentui") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 
 async def test_protocol():
@@ -213,6 +216,15 @@ async def test_skills():
     print("  Skills tests passed!\n")
 
 
+async def _run(name, test_func):
+    """Run one test, returning its name and the exception it raised, if any."""
+    try:
+        await test_func()
+        return name, None
+    except Exception as e:
+        return name, e
+
+
 async def main():
     """Run all tests."""
     print("=" * 50)
@@ -228,19 +240,17 @@ async def main():
         ("Skills", test_skills),
     ]
     
-    passed = 0
-    failed = 0
+    # The tests are independent, so run them together and report in order
+    results = await asyncio.gather(*(_run(name, fn) for name, fn in tests))
     
-    for name, test_func in tests:
-        try:
-            await test_func()
-            passed += 1
-        except Exception as e:
-            print(f"  ✗ {name} test failed: {e}")
+    failed = 0
+    for name, error in results:
+        if error is not None:
+            print(f"  ✗ {name} test failed: {error}")
             failed += 1
-            import traceback
-            traceback.print_exc()
+            traceback.print_exception(error)
             print()
+    passed = len(results) - failed
     
     print("=" * 50)
     print(f"Results: {passed} passed, {failed} failed")
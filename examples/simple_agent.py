@@ -14,22 +14,104 @@ Run:
     python examples/simple_agent.py
 """
 
+import ast
 import asyncio
+import importlib.util
 import sys
 import logging
+import operator
+from functools import lru_cache
 from pathlib import Path
 
-# Add src to path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path for development when agentui is not installed (e.g. via pip install -e .)
+if importlib.util.find_spec("agentui") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from agentui import AgentApp
 
-# Setup logging
+# Setup logging. Timestamps are milliseconds since startup, which avoids the
+# strftime/localtime call that %(asctime)s makes for every record.
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    format="%(relativeCreated)7dms [%(levelname)s] %(name)s: %(message)s"
 )
 
+# Characters accepted by the calculate tool
+_ALLOWED_CHARS = frozenset("0123456789 \t+-*/%.()")
+
+# Operators the calculator evaluates; any other syntax is rejected
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+@lru_cache(maxsize=512)
+def _calculate_expression(expression: str) -> int | float:
+    """
+    Parse and evaluate an arithmetic expression.
+
+    Expressions contain only literals, so the result is a pure function of the
+    string and repeated inputs are answered from the cache. Errors are raised
+    again on every call, since lru_cache does not store exceptions.
+    """
+    return _evaluate(ast.parse(expression, mode="eval").body)
+
+
+def _evaluate(node: ast.expr) -> int | float:
+    """Evaluate a parsed arithmetic expression tree."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        return _BINARY_OPS[type(node.op)](_evaluate(node.left), _evaluate(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_evaluate(node.operand))
+    raise ValueError(f"unsupported syntax: {ast.dump(node)}")
+
+# Simulated weather data for demo, with the response fields precomputed
+_WEATHER = {
+    name: {
+        "temperature_celsius": temp,
+        "temperature_fahrenheit": round(temp * 9/5 + 32),
+        "conditions": conditions,
+        "humidity_percent": humidity,
+        "wind": wind,
+        "source": "Demo Weather Service",
+    }
+    for name, temp, conditions, humidity, wind in (
+        ("copenhagen", 8, "Cloudy", 75, "15 km/h NW"),
+        ("new york", 15, "Sunny", 45, "10 km/h E"),
+        ("tokyo", 20, "Partly Cloudy", 60, "5 km/h S"),
+        ("london", 10, "Rainy", 85, "20 km/h W"),
+        ("paris", 12, "Overcast", 70, "8 km/h N"),
+        ("sydney", 25, "Sunny", 55, "12 km/h SE"),
+    )
+}
+
+# Lookup table that also accepts the title-cased spellings an LLM usually
+# sends, so the common case is one dict hit with no string normalization
+_CITY_INDEX = {**_WEATHER, **{name.title(): data for name, data in _WEATHER.items()}}
+
+# Generic data returned for unknown cities
+_UNKNOWN_WEATHER = {
+    "temperature_celsius": 18,
+    "temperature_fahrenheit": 64,
+    "conditions": "Unknown",
+    "humidity_percent": 50,
+    "wind": "Variable",
+    "note": "This is simulated data for demo purposes",
+    "source": "Demo Weather Service",
+}
+
 # Create the app
 app = AgentApp(
     name="weather-assistant",
@@ -63,41 +145,10 @@ Always be friendly and concise. When you use a tool, explain what you found.""",
 )
 def get_weather(city: str) -> dict:
     """Mock weather lookup - returns simulated weather data."""
-    # Simulated weather data for demo
-    weather_data = {
-        "copenhagen": {"temp": 8, "conditions": "Cloudy", "humidity": 75, "wind": "15 km/h NW"},
-        "new york": {"temp": 15, "conditions": "Sunny", "humidity": 45, "wind": "10 km/h E"},
-        "tokyo": {"temp": 20, "conditions": "Partly Cloudy", "humidity": 60, "wind": "5 km/h S"},
-        "london": {"temp": 10, "conditions": "Rainy", "humidity": 85, "wind": "20 km/h W"},
-        "paris": {"temp": 12, "conditions": "Overcast", "humidity": 70, "wind": "8 km/h N"},
-        "sydney": {"temp": 25, "conditions": "Sunny", "humidity": 55, "wind": "12 km/h SE"},
-    }
-    
-    city_lower = city.lower().strip()
-    
-    if city_lower in weather_data:
-        data = weather_data[city_lower]
-        return {
-            "city": city.title(),
-            "temperature_celsius": data["temp"],
-            "temperature_fahrenheit": round(data["temp"] * 9/5 + 32),
-            "conditions": data["conditions"],
-            "humidity_percent": data["humidity"],
-            "wind": data["wind"],
-            "source": "Demo Weather Service",
-        }
-    
-    # Return generic data for unknown cities
-    return {
-        "city": city.title(),
-        "temperature_celsius": 18,
-        "temperature_fahrenheit": 64,
-        "conditions": "Unknown",
-        "humidity_percent": 50,
-        "wind": "Variable",
-        "note": "This is simulated data for demo purposes",
-        "source": "Demo Weather Service",
-    }
+    data = _CITY_INDEX.get(city)
+    if data is None:
+        data = _CITY_INDEX.get(city.strip().lower(), _UNKNOWN_WEATHER)
+    return {"city": city.title(), **data}
 
 
 @app.tool(
@@ -116,13 +167,11 @@ def get_weather(city: str) -> dict:
 )
 def calculate(expression: str) -> dict:
     """Safe calculator with basic math operations."""
-    import re
-    
     # Clean the expression
     expression = expression.strip()
     
     # Validate - only allow safe characters
-    if not re.match(r'^[\d\s\+\-\*\/\%\.\(\)]+$', expression):
+    if not expression or not _ALLOWED_CHARS.issuperset(expression):
         return {
             "error": "Invalid expression. Only numbers and basic operators (+, -, *, /, %, parentheses) are allowed.",
             "expression": expression,
@@ -130,7 +179,7 @@ def calculate(expression: str) -> dict:
     
     try:
         # Evaluate safely
-        result = eval(expression, {"__builtins__": {}}, {})
+        result = _calculate_expression(expression)
         
         # Format result
         if isinstance(result, float):
@@ -2,6 +2,10 @@
 
 import random  # For demo purposes - replace with real weather API in production
 
+_CURRENT_CONDITIONS = ("Sunny", "Partly cloudy", "Cloudy", "Rainy", "Windy")
+_FORECAST_CONDITIONS = ("Sunny", "Partly cloudy", "Cloudy", "Rainy", "Stormy")
+_DAY_NAMES = ("Today", "Tomorrow", "Day 3", "Day 4", "Day 5", "Day 6", "Day 7")
+
 
 def get_weather(city: str, units: str = "celsius") -> dict:
     """
@@ -24,7 +28,7 @@ def get_weather(city: str, units: str = "celsius") -> dict:
     else:
         temp_str = f"{base_temp}°C"
 
-    conditions = random.choice(["Sunny", "Partly cloudy", "Cloudy", "Rainy", "Windy"])
+    conditions = random.choice(_CURRENT_CONDITIONS)
 
     return {
         "city": city,
@@ -55,19 +59,21 @@ def get_forecast(city: str, days: int = 3) -> dict:
             "error": "Days must be between 1 and 7",
         }
 
-    forecast_days = []
-    day_names = ["Today", "Tomorrow", "Day 3", "Day 4", "Day 5", "Day 6", "Day 7"]
-
-    for i in range(days):
-        conditions = ["Sunny", "Partly cloudy", "Cloudy", "Rainy", "Stormy"]
-
-        forecast_days.append({
-            "day": day_names[i],
-            "high": f"{random.randint(15, 30)}°C",
-            "low": f"{random.randint(5, 15)}°C",
-            "conditions": conditions[i % len(conditions)],
-            "precipitation": f"{random.randint(0, 80)}%",
-        })
+    # Draw each series for all days in one call
+    highs = random.choices(range(15, 31), k=days)
+    lows = random.choices(range(5, 16), k=days)
+    precipitation = random.choices(range(0, 81), k=days)
+
+    forecast_days = [
+        {
+            "day": _DAY_NAMES[i],
+            "high": f"{high}°C",
+            "low": f"{low}°C",
+            "conditions": _FORECAST_CONDITIONS[i % len(_FORECAST_CONDITIONS)],
+            "precipitation": f"{rain}%",
+        }
+        for i, high, low, rain in zip(range(days), highs, lows, precipitation)
+    ]
 
     return {
         "city": city,
@@ -388,6 +388,7 @@ func (m Model) handleChatKeys(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 	case "ctrl+l":
 		// Clear chat
 		m.messages = []Message{}
+		m.markdownView.ClearCache()
 		m.viewport.SetContent("")
 		return m, nil
 
@@ -640,6 +641,7 @@ func (m Model) handleProtocolMsg(msg *protocol.Message) (tea.Model, tea.Cmd) {
 		}
 		if payload.Scope == "chat" || payload.Scope == "all" {
 			m.messages = []Message{}
+			m.markdownView.ClearCache()
 			m.viewport.SetContent("")
 		}
 		if payload.Scope == "progress" || payload.Scope == "all" {
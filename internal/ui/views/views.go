@@ -3,6 +3,7 @@ package views
 
 import (
 	"bytes"
+	"container/list"
 	"strconv"
 	"strings"
 
@@ -16,12 +17,61 @@ import (
 	"github.com/flight505/agentui/internal/theme"
 )
 
+// markdownCacheSize bounds how many rendered messages a MarkdownView keeps.
+const markdownCacheSize = 128
+
+// renderCache is a least-recently-used map from markdown source to its
+// rendered form.
+type renderCache struct {
+	entries map[string]*list.Element
+	order   *list.List // Most recently used at the front
+}
+
+type renderEntry struct {
+	content  string
+	rendered string
+}
+
+func (c *renderCache) get(content string) (string, bool) {
+	el, ok := c.entries[content]
+	if !ok {
+		return "", false
+	}
+	c.order.MoveToFront(el)
+	return el.Value.(*renderEntry).rendered, true
+}
+
+func (c *renderCache) put(content, rendered string) {
+	if c.entries == nil {
+		c.entries = make(map[string]*list.Element)
+		c.order = list.New()
+	}
+	c.entries[content] = c.order.PushFront(&renderEntry{content: content, rendered: rendered})
+	if c.order.Len() > markdownCacheSize {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.entries, oldest.Value.(*renderEntry).content)
+	}
+}
+
+func (c *renderCache) len() int {
+	return len(c.entries)
+}
+
+func (c *renderCache) clear() {
+	c.entries = nil
+	c.order = nil
+}
+
 // MarkdownView renders markdown content.
 type MarkdownView struct {
 	content  string
 	title    string
 	width    int
 	renderer *glamour.TermRenderer
+	// cache holds recent messages rendered at the current width, so
+	// redraws do not re-parse messages that have not changed.
+	cache renderCache
 }
 
 // NewMarkdownView creates a new markdown view.
@@ -43,6 +93,12 @@ func (m *MarkdownView) SetTitle(title string) {
 func (m *MarkdownView) SetWidth(width int) {
 	m.width = width
 	m.renderer = nil // Reset renderer to rebuild with new width
+	m.cache.clear()
+}
+
+// ClearCache drops rendered messages, e.g. once the chat is cleared.
+func (m *MarkdownView) ClearCache() {
+	m.cache.clear()
 }
 
 func (m *MarkdownView) getRenderer() *glamour.TermRenderer {
@@ -87,16 +143,27 @@ func (m *MarkdownView) View() string {
 		return sb.String()
 	}
 
-	renderer := m.getRenderer()
-	rendered, err := renderer.Render(m.content)
+	sb.WriteString(m.render(m.content))
+
+	return sb.String()
+}
+
+// render returns the rendered markdown, reusing earlier output for the same content.
+func (m *MarkdownView) render(content string) string {
+	if rendered, ok := m.cache.get(content); ok {
+		return rendered
+	}
+
+	rendered, err := m.getRenderer().Render(content)
 	if err != nil {
 		// Fallback to plain text
-		sb.WriteString(m.content)
+		rendered = content
 	} else {
-		sb.WriteString(strings.TrimSpace(rendered))
+		rendered = strings.TrimSpace(rendered)
 	}
 
-	return sb.String()
+	m.cache.put(content, rendered)
+	return rendered
 }
 
 func stringPtr(s string) *string {
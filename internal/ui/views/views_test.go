@@ -0,0 +1,59 @@
+package views
+
+import (
+	"strconv"
+	"testing"
+)
+
+func TestMarkdownView_CachesRenderedContent(t *testing.T) {
+	m := NewMarkdownView()
+	m.SetWidth(80)
+	m.SetContent("## Title\n\n- one\n- two")
+
+	first := m.View()
+	if first == "" {
+		t.Fatal("View() returned empty output")
+	}
+	if m.cache.len() != 1 {
+		t.Fatalf("Expected 1 cached render, got %d", m.cache.len())
+	}
+
+	if second := m.View(); second != first {
+		t.Errorf("Cached render differs from first render")
+	}
+
+	m.SetWidth(40)
+	if m.cache.len() != 0 {
+		t.Error("SetWidth() should drop renders made at the old width")
+	}
+}
+
+func TestMarkdownView_ClearCache(t *testing.T) {
+	m := NewMarkdownView()
+	m.SetContent("hello")
+	m.View()
+
+	m.ClearCache()
+	if m.cache.len() != 0 {
+		t.Errorf("Expected empty cache after ClearCache(), got %d", m.cache.len())
+	}
+}
+
+func TestRenderCache_EvictsLeastRecentlyUsed(t *testing.T) {
+	var c renderCache
+	for i := 0; i < markdownCacheSize; i++ {
+		c.put(strconv.Itoa(i), "r")
+	}
+	c.get("0") // "1" is now the least recently used
+
+	c.put("new", "r")
+	if c.len() != markdownCacheSize {
+		t.Fatalf("Expected %d entries, got %d", markdownCacheSize, c.len())
+	}
+	if _, ok := c.get("0"); !ok {
+		t.Error("Recently used entry was evicted")
+	}
+	if _, ok := c.get("1"); ok {
+		t.Error("Least recently used entry was kept")
+	}
+}
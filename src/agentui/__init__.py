@@ -2,9 +2,9 @@
 AgentUI - Beautiful AI agent applications with Charm-quality TUIs.
 """
 
-from agentui.app import AgentApp
-from agentui.bridge import CLIBridge, TUIBridge, TUIConfig, create_bridge
-from agentui.core import AgentCore
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from agentui.exceptions import (
     AgentUIError,
     BridgeError,
@@ -16,31 +16,36 @@ from agentui.exceptions import (
     ToolExecutionError,
     ValidationError,
 )
-from agentui.primitives import (
-    UIAlert,
-    UICode,
-    UIConfirm,
-    UIForm,
-    UIFormField,
-    UIMarkdown,
-    UIProgress,
-    UIProgressStep,
-    UISelect,
-    UITable,
-    UIText,
-)
-from agentui.protocol import (
-    Message,
-    MessageType,
-    alert_payload,
-    code_payload,
-    confirm_payload,
-    form_field,
-    form_payload,
-    progress_payload,
-    select_payload,
-    table_payload,
-)
+
+if TYPE_CHECKING:
+    from agentui.app import AgentApp
+    from agentui.bridge import CLIBridge, TUIBridge, TUIConfig, create_bridge
+    from agentui.core import AgentCore
+    from agentui.primitives import (
+        UIAlert,
+        UICode,
+        UIConfirm,
+        UIForm,
+        UIFormField,
+        UIMarkdown,
+        UIProgress,
+        UIProgressStep,
+        UISelect,
+        UITable,
+        UIText,
+    )
+    from agentui.protocol import (
+        Message,
+        MessageType,
+        alert_payload,
+        code_payload,
+        confirm_payload,
+        form_field,
+        form_payload,
+        progress_payload,
+        select_payload,
+        table_payload,
+    )
 
 __version__ = "0.1.0"
 
@@ -86,3 +91,49 @@ __all__ = [
     "select_payload",
     "alert_payload",
 ]
+
+# Public names imported on first access (PEP 562), so `import agentui` does not
+# pull in the app, bridge and provider machinery until it is actually used.
+_LAZY_IMPORTS = {
+    "AgentApp": "agentui.app",
+    "AgentCore": "agentui.core",
+    "TUIBridge": "agentui.bridge",
+    "CLIBridge": "agentui.bridge",
+    "TUIConfig": "agentui.bridge",
+    "create_bridge": "agentui.bridge",
+    "UIForm": "agentui.primitives",
+    "UIFormField": "agentui.primitives",
+    "UIProgress": "agentui.primitives",
+    "UIProgressStep": "agentui.primitives",
+    "UITable": "agentui.primitives",
+    "UICode": "agentui.primitives",
+    "UIConfirm": "agentui.primitives",
+    "UISelect": "agentui.primitives",
+    "UIAlert": "agentui.primitives",
+    "UIText": "agentui.primitives",
+    "UIMarkdown": "agentui.primitives",
+    "Message": "agentui.protocol",
+    "MessageType": "agentui.protocol",
+    "form_field": "agentui.protocol",
+    "form_payload": "agentui.protocol",
+    "table_payload": "agentui.protocol",
+    "code_payload": "agentui.protocol",
+    "progress_payload": "agentui.protocol",
+    "confirm_payload": "agentui.protocol",
+    "select_payload": "agentui.protocol",
+    "alert_payload": "agentui.protocol",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported name on first access and cache it."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
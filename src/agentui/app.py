@@ -42,15 +42,17 @@ Example:
     >>> asyncio.run(app.run(prompt="Hello!"))
 """
 
+import asyncio
+import copy
 import logging
 import os
+from collections import OrderedDict
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from agentui.bridge import CLIBridge, TUIBridge, TUIConfig, managed_bridge
+from agentui.config import load_yaml
 from agentui.core import AgentCore
 from agentui.types import (
     AgentConfig,
@@ -61,6 +63,25 @@ from agentui.types import (
 
 logger = logging.getLogger(__name__)
 
+# Environment variable holding the API key for each provider
+_PROVIDER_ENV_VARS = {
+    "claude": "ANTHROPIC_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "gemini": "GOOGLE_API_KEY",
+}
+
+# Parsed manifests by resolved path, stored with the (mtime_ns, size) they
+# were read at so an edited file is parsed again
+_MANIFEST_CACHE: dict[str, tuple[int, int, AppManifest]] = {}
+
+# LLM providers shared by quick_chat() calls with the same provider, model
+# and API key, so they reuse one SDK client and its connection pool. Least
+# recently used first; see clear_quick_chat_providers()
+_QUICK_CHAT_PROVIDERS: OrderedDict[tuple[str, str | None, str | None], Any] = OrderedDict()
+
+# Most providers quick_chat() keeps alive at once
+QUICK_CHAT_PROVIDER_LIMIT = 4
+
 
 class AgentApp:
     """
@@ -77,7 +98,7 @@ class AgentApp:
     Attributes:
         manifest: Application manifest loaded from app.yaml or provided directly
         config: Agent configuration (provider, model, prompts, etc.)
-        _core: AgentCore instance (created when run() is called)
+        _core: AgentCore instance (created on first run() or chat())
         _bridge: UI bridge instance (TUIBridge or CLIBridge)
         _tools: List of registered tool definitions
         _debug: Debug mode flag
@@ -115,7 +136,7 @@ class AgentApp:
         self,
         name: str = "agent",
         manifest: str | Path | AppManifest | None = None,
-        provider: str = "claude",
+        provider: str | ProviderType = "claude",
         model: str | None = None,
         api_key: str | None = None,
         max_tokens: int = 4096,
@@ -137,7 +158,8 @@ class AgentApp:
             manifest: Path to app.yaml file, directory containing app.yaml,
                 or an AppManifest object. If provided, loads configuration
                 from the manifest.
-            provider: LLM provider name ("claude", "openai", "gemini")
+            provider: LLM provider name ("claude", "openai", "gemini") or
+                ProviderType member
             model: Model identifier. If None, uses provider default
                 (e.g., "claude-3-5-sonnet-20241022" for Claude)
             api_key: API key for the LLM provider. If None, reads from
@@ -174,11 +196,14 @@ class AgentApp:
         else:
             self.manifest = AppManifest(name=name)
 
+        if not isinstance(provider, ProviderType):
+            provider = ProviderType(provider)
+
         # Build config from manifest and overrides
         self.config = AgentConfig(
-            provider=ProviderType(provider),
+            provider=provider,
             model=model or self.manifest.model,
-            api_key=api_key or self._get_api_key(provider),
+            api_key=api_key or self._get_api_key(provider.value),
             max_tokens=max_tokens,
             temperature=temperature,
             system_prompt=(
@@ -200,6 +225,9 @@ class AgentApp:
         """
         Load application manifest from YAML file.
 
+        Parsed manifests are cached per file and reused until the file's
+        modification time or size changes. Each caller gets its own copy.
+
         Args:
             path: Path to app.yaml file or directory containing it
 
@@ -214,13 +242,22 @@ class AgentApp:
         if path.is_dir():
             path = path / "app.yaml"
 
-        if not path.exists():
-            raise FileNotFoundError(f"Manifest not found: {path}")
+        try:
+            st = path.stat()
+        except OSError:
+            raise FileNotFoundError(f"Manifest not found: {path}") from None
 
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        key = str(path.resolve())
+        cached = _MANIFEST_CACHE.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            manifest = cached[2]
+        else:
+            with open(path) as f:
+                data = load_yaml(f)
+            manifest = AppManifest.from_dict(data)
+            _MANIFEST_CACHE[key] = (st.st_mtime_ns, st.st_size, manifest)
 
-        return AppManifest.from_dict(data)
+        return copy.deepcopy(manifest)
 
     def _get_api_key(self, provider: str) -> str | None:
         """
@@ -232,12 +269,7 @@ class AgentApp:
         Returns:
             API key from environment, or None if not found
         """
-        env_vars = {
-            "claude": "ANTHROPIC_API_KEY",
-            "openai": "OPENAI_API_KEY",
-            "gemini": "GOOGLE_API_KEY",
-        }
-        var_name = env_vars.get(provider)
+        var_name = _PROVIDER_ENV_VARS.get(provider)
         key = os.environ.get(var_name) if var_name else None
         if not key and provider in ("claude", "openai"):
             logger.warning(f"No API key found for {provider}. Set {var_name} environment variable.")
@@ -286,7 +318,10 @@ class AgentApp:
                 requires_confirmation=requires_confirmation,
             )
             self._tools.append(tool_def)
-            logger.debug(f"Registered tool: {name}")
+            # A core built by an earlier chat() or run() must see it too
+            if self._core is not None:
+                self._core.register_tool(tool_def)
+            logger.debug("Registered tool: %s", name)
             return func
         return decorator
 
@@ -331,6 +366,22 @@ class AgentApp:
         """
         return self.tool(name, description, parameters, is_ui_tool=True)
 
+    def _ensure_core(self) -> AgentCore:
+        """
+        Return the AgentCore, creating it and registering tools on first use.
+
+        The core is only built once something needs it, so an app that is
+        configured but never run or chatted with does no core setup. The
+        LLM provider client is created lazily by the core itself.
+
+        Returns:
+            The app's AgentCore instance
+        """
+        if self._core is None:
+            self._core = AgentCore(config=self.config)
+            self._core.register_tools(self._tools)
+        return self._core
+
     async def run(self, prompt: str | None = None) -> None:
         """
         Run the agent application in interactive mode.
@@ -339,12 +390,16 @@ class AgentApp:
         is unavailable). The agent runs in a loop, processing user messages
         and executing tools until the user exits.
 
+        Each run starts a new conversation; history from earlier chat()
+        calls is not carried into it.
+
         This method manages the complete lifecycle:
-        1. Initializes the UI bridge (TUI or CLI)
-        2. Creates the AgentCore
-        3. Registers all tools
-        4. Processes initial prompt if provided
-        5. Runs the main event loop until user exits
+        1. Creates the AgentCore and registers all tools, or starts a new
+           conversation on the one an earlier chat() created
+        2. Initializes the UI bridge (TUI or CLI) while the LLM provider
+           client is built in the background
+        3. Processes initial prompt if provided
+        4. Runs the main event loop until user exits
 
         Args:
             prompt: Optional initial message to send to the agent. If provided,
@@ -363,31 +418,48 @@ class AgentApp:
             debug=self._debug,
         )
 
-        async with managed_bridge(tui_config, fallback=True) as bridge:
-            from typing import cast
-            typed_bridge = cast(TUIBridge | CLIBridge, bridge)
-            self._bridge = typed_bridge
-
-            # Create core
-            self._core = AgentCore(config=self.config, bridge=typed_bridge)
-
-            # Register tools
-            for tool in self._tools:
-                self._core.register_tool(tool)
-
-            # Send initial prompt if provided
-            if prompt:
-                try:
-                    async for chunk in self._core.process_message(prompt):
-                        if chunk.content:
+        # The core and its tools do not need the bridge yet
+        core = self._ensure_core()
+        core.reset_state()
+
+        # Build the provider client while the bridge starts up and, in
+        # interactive mode, while the user types the first message
+        warm_up = asyncio.create_task(core.warm_up())
+
+        try:
+            async with managed_bridge(tui_config, fallback=True) as bridge:
+                from typing import cast
+                typed_bridge = cast(TUIBridge | CLIBridge, bridge)
+                self._bridge = typed_bridge
+                core.bridge = typed_bridge
+
+                # Send initial prompt if provided
+                if prompt:
+                    # The prompt needs the client now; don't build a second
+                    # one. A failed warm-up is logged below, not raised.
+                    await asyncio.wait((warm_up,))
+                    try:
+                        # Send each chunk before resuming the stream: tool calls
+                        # run inside it and may render UI that must follow the
+                        # text. The bridges coalesce small writes themselves.
+                        text_chunks = (
+                            c async for c in core.process_message(prompt) if c.content
+                        )
+                        async for chunk in text_chunks:
                             await bridge.send_text(chunk.content, done=chunk.is_complete)
-                    await bridge.send_done()
-                except Exception as e:
-                    logger.error(f"Error processing initial prompt: {e}")
-                    await bridge.send_alert(str(e), severity="error")
-
-            # Run main loop
-            await self._core.run_loop()
+                        await bridge.send_done()
+                    except Exception as e:
+                        logger.error(f"Error processing initial prompt: {e}")
+                        await bridge.send_alert(str(e), severity="error")
+
+                # Run main loop
+                await core.run_loop()
+        finally:
+            # Warm-up is only an optimization: log its errors, don't raise them
+            warm_up.cancel()
+            (result,) = await asyncio.gather(warm_up, return_exceptions=True)
+            if isinstance(result, Exception):
+                logger.warning(f"Provider warm-up failed: {result!r}")
 
     async def chat(self, message: str) -> str:
         """
@@ -418,16 +490,14 @@ class AgentApp:
             >>> print(response2)
             'Paris has a population of approximately 2.2 million people...'
         """
-        if not self._core:
-            self._core = AgentCore(config=self.config)
-            for tool in self._tools:
-                self._core.register_tool(tool)
+        core = self._ensure_core()
 
-        response = ""
-        async for chunk in self._core.process_message(message):
-            response += chunk.content
+        parts: list[str] = []
+        async for chunk in core.process_message(message):
+            if chunk.content:
+                parts.append(chunk.content)
 
-        return response
+        return "".join(parts)
 
 
 # --- Convenience functions ---
@@ -458,6 +528,11 @@ async def quick_chat(
     """
     Quick one-shot chat without creating an app.
 
+    Each call starts a fresh conversation. The LLM provider, and with it the
+    SDK client and its open connections, is shared between calls using the
+    same provider, model and API key. Up to QUICK_CHAT_PROVIDER_LIMIT
+    providers are kept; call clear_quick_chat_providers() to release them.
+
     Args:
         message: User message
         provider: LLM provider
@@ -472,4 +547,28 @@ async def quick_chat(
         model=model,
         system_prompt=system_prompt,
     )
-    return await app.chat(message)
+    core = app._ensure_core()
+
+    key = (provider, app.config.model, app.config.api_key)
+    shared = _QUICK_CHAT_PROVIDERS.get(key)
+    if shared is not None:
+        _QUICK_CHAT_PROVIDERS.move_to_end(key)
+        core.set_provider(shared)
+
+    response = await app.chat(message)
+
+    if shared is None and core.provider is not None:
+        _QUICK_CHAT_PROVIDERS.setdefault(key, core.provider)
+        while len(_QUICK_CHAT_PROVIDERS) > QUICK_CHAT_PROVIDER_LIMIT:
+            _QUICK_CHAT_PROVIDERS.popitem(last=False)
+    return response
+
+
+def clear_quick_chat_providers() -> None:
+    """
+    Drop the providers shared by quick_chat() calls.
+
+    Their SDK clients, and the connections they hold, are released once
+    nothing else references them. The next quick_chat() creates a new one.
+    """
+    _QUICK_CHAT_PROVIDERS.clear()
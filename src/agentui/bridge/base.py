@@ -12,9 +12,10 @@ The BaseBridge interface defines methods for:
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from typing import Literal
 
+from agentui.primitives import UIFormField
 from agentui.protocol import Message
 
 
@@ -104,7 +105,7 @@ class BaseBridge(ABC):
         self,
         message: str,
         percent: float | None = None,
-        steps: list[dict] | None = None,
+        steps: Sequence[dict] | None = None,
     ) -> None:
         """
         Send progress indicator update.
@@ -112,14 +113,14 @@ class BaseBridge(ABC):
         Args:
             message: Progress message
             percent: Optional percentage (0-100)
-            steps: Optional list of step dictionaries
+            steps: Optional sequence of step dictionaries
         """
         pass
 
     @abstractmethod
     async def request_form(
         self,
-        fields: list[dict],
+        fields: Sequence[UIFormField | dict],
         title: str | None = None,
         description: str | None = None,
     ) -> dict | None:
@@ -127,7 +128,7 @@ class BaseBridge(ABC):
         Show a form and block until user submits.
 
         Args:
-            fields: List of field dictionaries
+            fields: Form fields, as UIFormField objects or field dictionaries
             title: Optional form title
             description: Optional form description
 
@@ -139,8 +140,8 @@ class BaseBridge(ABC):
     @abstractmethod
     async def send_table(
         self,
-        columns: list[str],
-        rows: list[list[str]],
+        columns: Sequence[str],
+        rows: Sequence[Sequence[str]],
         title: str | None = None,
         footer: str | None = None,
     ) -> None:
@@ -149,7 +150,7 @@ class BaseBridge(ABC):
 
         Args:
             columns: Column headers
-            rows: List of row lists
+            rows: Sequence of rows, each a sequence of cell strings
             title: Optional table title
             footer: Optional footer text
         """
@@ -1,15 +1,133 @@
 """CLI Bridge using Rich for fallback rendering."""
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator
-from typing import Literal
+import os
+import select
+import sys
+import weakref
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Any, Literal, TextIO, TypeVar
 
 from agentui.bridge.base import BaseBridge
 from agentui.bridge.tui_bridge import TUIConfig
+from agentui.primitives import UIFormField
 from agentui.protocol import Message
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Streamed text is printed once this many characters are buffered, or after
+# TEXT_FLUSH_DELAY seconds, whichever comes first
+TEXT_FLUSH_CHARS = 512
+TEXT_FLUSH_DELAY = 0.016
+
+# Highlighted code panels each bridge keeps for repeated send_code() calls
+CODE_CACHE_SIZE = 16
+
+# Rich markup for each progress step status
+_STEP_ICONS = {
+    "complete": "[green]✓[/green]",
+    "running": "[blue]●[/blue]",
+    "error": "[red]✗[/red]",
+    "pending": "[dim]○[/dim]",
+}
+
+# Rich style for each alert severity
+_ALERT_STYLES = {
+    "info": "blue",
+    "success": "green",
+    "warning": "yellow",
+    "error": "red",
+}
+
+
+class _StdinReader:
+    """
+    Reads lines from stdin for prompts running in a worker thread.
+
+    Each read also waits on a wake-up descriptor, so a prompt whose caller
+    has been cancelled (Ctrl+C under asyncio.run()) can be released rather
+    than left blocked in input(), where it would hold the stdin lock at
+    exit and swallow the next line typed.
+    """
+
+    def __init__(self, fd: int, encoding: str = "utf-8"):
+        self._fd = fd
+        self._encoding = encoding
+        self._buffer = bytearray()
+
+    @classmethod
+    def for_stdin(cls) -> "_StdinReader | None":
+        """Return a reader for sys.stdin, or None if it cannot be waited on."""
+        if sys.platform == "win32":
+            return None  # select() only accepts sockets there
+        try:
+            fd = sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+        return cls(fd, sys.stdin.encoding or "utf-8")
+
+    def readline(self, wake_fd: int) -> str:
+        """
+        Read one line, without its line ending, like input().
+
+        Raises:
+            EOFError: If stdin is closed or wake_fd becomes readable first
+        """
+        while (end := self._buffer.find(b"\n")) < 0:
+            ready, _, _ = select.select([self._fd, wake_fd], [], [])
+            if wake_fd in ready:
+                raise EOFError
+            chunk = os.read(self._fd, 4096)
+            if not chunk:
+                if not self._buffer:
+                    raise EOFError
+                chunk = b"\n"  # Last line had no line ending
+            self._buffer += chunk
+
+        line = self._buffer[:end].decode(self._encoding, errors="replace")
+        del self._buffer[: end + 1]
+        return line.removesuffix("\r")
+
+
+class _PromptStream:
+    """
+    The ``stream`` handed to one prompt: stdin lines until it is woken.
+
+    Only readline() is provided, which is all Rich prompts and _input() use.
+    """
+
+    def __init__(self, reader: _StdinReader, wake_fd: int):
+        self._reader = reader
+        self._wake_fd = wake_fd
+
+    def readline(self) -> str:
+        return self._reader.readline(self._wake_fd)
+
+
+def _write_text(parts: list[str], console: Any, end: str = "") -> None:
+    """Write and clear buffered text chunks with one call."""
+    if not parts and not end:
+        return
+    text = "".join(parts)
+    parts.clear()
+    if console:
+        # Model output is plain text: out() skips markup parsing,
+        # highlighting and re-wrapping each chunk from column zero
+        console.out(text, end=end, highlight=False)
+    else:
+        print(text, end=end, flush=True)
+
+
+def _input(prompt: str, stream: TextIO | None = None) -> str:
+    """input() that reads from a prompt stream when given one."""
+    if stream is None:
+        return input(prompt)
+    print(prompt, end="", flush=True)
+    return stream.readline()
+
 
 class CLIBridge(BaseBridge):
     """
@@ -22,6 +140,14 @@ class CLIBridge(BaseBridge):
         self.config = config or TUIConfig()
         self._running = False
         self._console = None
+        # Streamed text chunks waiting to be written in a single print
+        self._text_buffer: list[str] = []
+        self._text_size = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Rendered code panels by (code, language, title, width), oldest first
+        self._code_cache: dict[tuple[str, str, str | None, int], tuple[Any, ...]] = {}
+        # Prompts read stdin through this in a worker thread when possible
+        self._stdin = _StdinReader.for_stdin()
 
         try:
             from rich.console import Console
@@ -29,6 +155,10 @@ class CLIBridge(BaseBridge):
         except ImportError:
             pass
 
+        # If the event loop ends before the flush timer fires, text still
+        # buffered is written when the bridge is collected or at exit
+        weakref.finalize(self, _write_text, self._text_buffer, self._console)
+
     @property
     def is_running(self) -> bool:
         return self._running
@@ -45,19 +175,70 @@ class CLIBridge(BaseBridge):
 
     async def stop(self) -> None:
         """Stop CLI mode."""
+        self._flush_text()
         self._running = False
         if self._console:
             self._console.print("\n[dim]Goodbye![/dim]")
 
+    async def _ask(self, prompt: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking prompt in a thread so the event loop keeps running.
+
+        The prompt reads stdin through the ``stream`` it is passed. If the
+        caller is cancelled while the user is still typing, the thread is
+        woken and exits, leaving the unread input for the next prompt.
+        Where stdin cannot be waited on, the prompt runs on the loop thread.
+        """
+        if self._stdin is None:
+            return prompt(*args, **kwargs)
+
+        wake_r, wake_w = os.pipe()
+        stream = _PromptStream(self._stdin, wake_r)
+
+        def run() -> T:
+            try:
+                return prompt(*args, stream=stream, **kwargs)
+            finally:
+                os.close(wake_r)
+
+        try:
+            return await asyncio.to_thread(run)
+        finally:
+            # Closing the write end makes wake_r readable, releasing a
+            # thread still waiting on stdin
+            os.close(wake_w)
+
     async def send_text(self, content: str, done: bool = False) -> None:
-        """Print text."""
-        if self._console:
-            self._console.print(content, end="" if not done else "\n")
-        else:
-            print(content, end="" if not done else "\n")
+        """
+        Print text.
+
+        Partial chunks are buffered and written together once
+        TEXT_FLUSH_CHARS characters are waiting, TEXT_FLUSH_DELAY seconds
+        after the first of them, when a chunk ends a line, when the stream
+        is done, or before any other output.
+        """
+        self._text_buffer.append(content)
+        self._text_size += len(content)
+        if done:
+            self._flush_text(end="\n")
+        elif self._text_size >= TEXT_FLUSH_CHARS or content.endswith("\n"):
+            self._flush_text()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                TEXT_FLUSH_DELAY, self._flush_text
+            )
+
+    def _flush_text(self, end: str = "") -> None:
+        """Write buffered text chunks with one print call."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._text_size = 0
+        _write_text(self._text_buffer, self._console, end)
 
     async def send_markdown(self, content: str, title: str | None = None) -> None:
         """Print markdown."""
+        self._flush_text()
         if self._console:
             from rich.markdown import Markdown
             if title:
@@ -72,9 +253,10 @@ class CLIBridge(BaseBridge):
         self,
         message: str,
         percent: float | None = None,
-        steps: list[dict] | None = None,
+        steps: Sequence[dict] | None = None,
     ) -> None:
         """Show progress."""
+        self._flush_text()
         if self._console:
             if percent is not None:
                 self._console.print(f"[dim]{message}[/dim] [{percent:.0f}%]")
@@ -83,25 +265,32 @@ class CLIBridge(BaseBridge):
 
             if steps:
                 for step in steps:
-                    status_icons = {
-                        "complete": "[green]✓[/green]",
-                        "running": "[blue]●[/blue]",
-                        "error": "[red]✗[/red]",
-                        "pending": "[dim]○[/dim]",
-                    }
-                    icon = status_icons.get(step.get("status", "pending"), "○")
+                    icon = _STEP_ICONS.get(step.get("status", "pending"), "○")
                     self._console.print(f"  {icon} {step.get('label', '')}")
 
     async def request_form(
         self,
-        fields: list[dict],
+        fields: Sequence[UIFormField | dict],
         title: str | None = None,
         description: str | None = None,
     ) -> dict | None:
         """Collect form input via CLI."""
+        self._flush_text()
         if not self._console:
             return {}
 
+        # One thread hop for the whole form rather than one per field
+        return await self._ask(self._collect_form, fields, title, description)
+
+    def _collect_form(
+        self,
+        fields: Sequence[UIFormField | dict],
+        title: str | None,
+        description: str | None,
+        stream: TextIO | None = None,
+    ) -> dict:
+        """Prompt for each form field in turn (blocking)."""
+        assert self._console is not None
         from rich.prompt import Confirm, Prompt
 
         if title:
@@ -109,24 +298,31 @@ class CLIBridge(BaseBridge):
         if description:
             self._console.print(f"[dim]{description}[/dim]\n")
 
-        from typing import Any
         values: dict[str, Any] = {}
         for field in fields:
-            name = field.get("name", "")
-            label = field.get("label", name)
-            field_type = field.get("type", "text")
-            default = field.get("default", "")
+            if isinstance(field, UIFormField):
+                # Read primitives directly; no need to round-trip through to_dict()
+                name = field.name
+                label = field.label
+                field_type = field.type
+                default = field.default if field.default is not None else ""
+                options = field.options or []
+            else:
+                name = field.get("name", "")
+                label = field.get("label", name)
+                field_type = field.get("type", "text")
+                default = field.get("default", "")
+                options = field.get("options", [])
 
             if field_type == "checkbox":
                 # Confirm.ask returns bool, not bool | str
-                values[name] = bool(Confirm.ask(label, default=bool(default)))
+                values[name] = bool(Confirm.ask(label, default=bool(default), stream=stream))
             elif field_type == "select":
-                options = field.get("options", [])
                 if options:
                     self._console.print(f"[bold]{label}[/bold]")
                     for i, opt in enumerate(options, 1):
                         self._console.print(f"  {i}. {opt}")
-                    choice = Prompt.ask("Enter number", default="1")
+                    choice = Prompt.ask("Enter number", default="1", stream=stream)
                     try:
                         idx = int(choice) - 1
                         values[name] = options[idx] if 0 <= idx < len(options) else options[0]
@@ -134,7 +330,9 @@ class CLIBridge(BaseBridge):
                         values[name] = options[0]
             else:
                 # Text input always returns a string
-                text_value = Prompt.ask(label, default=str(default) if default else "")
+                text_value = Prompt.ask(
+                    label, default=str(default) if default else "", stream=stream
+                )
                 values[name] = str(text_value)
 
         return values
@@ -146,13 +344,14 @@ class CLIBridge(BaseBridge):
         destructive: bool = False,
     ) -> bool:
         """Get confirmation via CLI."""
+        self._flush_text()
         if self._console:
             from rich.prompt import Confirm
             style = "[yellow]" if destructive else ""
-            return Confirm.ask(f"{style}{message}")
+            return await self._ask(Confirm.ask, f"{style}{message}")
         else:
-            response = input(f"{message} [y/N]: ").strip().lower()
-            return response in ("y", "yes")
+            response = await self._ask(_input, f"{message} [y/N]: ")
+            return response.strip().lower() in ("y", "yes")
 
     async def request_select(
         self,
@@ -161,6 +360,7 @@ class CLIBridge(BaseBridge):
         default: str | None = None,
     ) -> str | None:
         """Get selection via CLI."""
+        self._flush_text()
         if self._console:
             self._console.print(f"\n[bold]{label}[/bold]")
             for i, opt in enumerate(options, 1):
@@ -168,7 +368,7 @@ class CLIBridge(BaseBridge):
                 self._console.print(f"{marker}{i}. {opt}")
 
             from rich.prompt import Prompt
-            choice = Prompt.ask("Enter number", default="1")
+            choice = await self._ask(Prompt.ask, "Enter number", default="1")
             try:
                 idx = int(choice) - 1
                 return options[idx] if 0 <= idx < len(options) else None
@@ -178,7 +378,7 @@ class CLIBridge(BaseBridge):
             print(f"\n{label}")
             for i, opt in enumerate(options, 1):
                 print(f"  {i}. {opt}")
-            choice = input("Enter number: ").strip()
+            choice = (await self._ask(_input, "Enter number: ")).strip()
             try:
                 idx = int(choice) - 1
                 return options[idx] if 0 <= idx < len(options) else None
@@ -187,12 +387,13 @@ class CLIBridge(BaseBridge):
 
     async def send_table(
         self,
-        columns: list[str],
-        rows: list[list[str]],
+        columns: Sequence[str],
+        rows: Sequence[Sequence[str]],
         title: str | None = None,
         footer: str | None = None,
     ) -> None:
         """Display table."""
+        self._flush_text()
         if self._console:
             from rich.table import Table
             table = Table(title=title)
@@ -211,11 +412,35 @@ class CLIBridge(BaseBridge):
         title: str | None = None,
     ) -> None:
         """Display code."""
+        self._flush_text()
         if self._console:
-            from rich.panel import Panel
-            from rich.syntax import Syntax
+            from rich.segment import Segments
+
+            segments = self._render_code(code, language, title)
+            # The rendered panel already ends with a newline
+            self._console.print(Segments(segments), end="")
+
+    def _render_code(self, code: str, language: str, title: str | None) -> tuple[Any, ...]:
+        """
+        Render a highlighted code panel to segments for this bridge's console.
+
+        Pygments lexing dominates send_code(), so the rendered segments are
+        cached and the same block shown again at the same width is printed
+        without re-highlighting.
+        """
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+
+        assert self._console is not None
+        key = (code, language, title, self._console.width)
+        segments = self._code_cache.get(key)
+        if segments is None:
             syntax = Syntax(code, language, theme="monokai", line_numbers=True)
-            self._console.print(Panel(syntax, title=title))
+            segments = tuple(self._console.render(Panel(syntax, title=title)))
+            if len(self._code_cache) >= CODE_CACHE_SIZE:
+                del self._code_cache[next(iter(self._code_cache))]
+            self._code_cache[key] = segments
+        return segments
 
     async def send_alert(
         self,
@@ -224,19 +449,19 @@ class CLIBridge(BaseBridge):
         title: str | None = None,
     ) -> None:
         """Show alert."""
+        self._flush_text()
         if self._console:
-            styles = {
-                "info": "blue",
-                "success": "green",
-                "warning": "yellow",
-                "error": "red"
-            }
-            style = styles.get(severity, "blue")
+            from rich.text import Text
+
+            # Styled Text skips the markup parser, and brackets in the
+            # message are printed as written
+            style = _ALERT_STYLES.get(severity, "blue")
             if title:
-                self._console.print(f"[{style} bold]{title}[/{style} bold]")
-            self._console.print(f"[{style}]{message}[/{style}]")
+                self._console.print(Text(title, style=f"{style} bold"))
+            self._console.print(Text(message, style=style))
 
     async def send_spinner(self, message: str) -> None:
+        self._flush_text()
         if self._console:
             self._console.print(f"[dim]⟳ {message}[/dim]")
 
@@ -249,22 +474,25 @@ class CLIBridge(BaseBridge):
         pass  # No status bar in CLI mode
 
     async def send_clear(self, scope: str = "chat") -> None:
+        self._flush_text()
         if self._console:
             self._console.clear()
 
     async def send_done(self, summary: str | None = None) -> None:
+        self._flush_text()
         if summary and self._console:
             self._console.print(f"\n[green]✓ {summary}[/green]")
 
     async def events(self) -> AsyncIterator[Message]:
         """Interactive input loop."""
         while self._running:
+            self._flush_text()
             try:
                 if self._console:
                     from rich.prompt import Prompt
-                    user_input = Prompt.ask("\n[bold]You[/bold]")
+                    user_input = await self._ask(Prompt.ask, "\n[bold]You[/bold]")
                 else:
-                    user_input = input("\nYou: ")
+                    user_input = await self._ask(_input, "\nYou: ")
 
                 if user_input.lower() in ("quit", "exit", "q"):
                     yield Message(type="quit", payload={})
@@ -1,11 +1,12 @@
 """TUI Bridge for Go subprocess communication."""
 
 import asyncio
+import contextvars
+import functools
 import json
 import logging
 import shutil
-import subprocess
-from collections.abc import AsyncGenerator, AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Literal
@@ -13,6 +14,7 @@ from typing import Any, Literal
 from agentui.bridge.base import BaseBridge
 from agentui.config import TUIConfig
 from agentui.exceptions import ConnectionError, ProtocolError, ValidationError
+from agentui.primitives import UIFormField
 from agentui.protocol import (
     Message,
     MessageType,
@@ -35,6 +37,65 @@ from agentui.protocol import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on messages waiting for the writer. When the TUI stops reading
+# stdin, senders wait for room instead of buffering the whole stream.
+OUTGOING_QUEUE_SIZE = 1024
+
+# Longest line accepted from the TUI's stdout or stderr
+LINE_LIMIT = 1 << 20
+
+_TEXT_TYPE = MessageType.TEXT.value
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_tui_binary(tui_path: str | None) -> str:
+    """
+    Locate the agentui-tui binary.
+
+    create_bridge() probes for the binary and start() looks it up again,
+    so a successful lookup is cached. Failures raise and are not cached,
+    letting a binary built later still be found.
+    """
+    if tui_path:
+        path = Path(tui_path)
+        if path.exists():
+            return str(path)
+        raise FileNotFoundError(f"TUI binary not found at: {path}")
+
+    # Check common locations
+    candidates = [
+        # Development location (relative to this file)
+        Path(__file__).parent.parent.parent.parent / "bin" / "agentui-tui",
+        # Installed via pip (in package)
+        Path(__file__).parent / "bin" / "agentui-tui",
+        # System PATH
+        "agentui-tui",
+    ]
+
+    for candidate in candidates:
+        if isinstance(candidate, Path):
+            if candidate.exists():
+                return str(candidate)
+        else:
+            found = shutil.which(str(candidate))
+            if found:
+                return str(found)
+
+    raise FileNotFoundError(
+        "agentui-tui binary not found. "
+        "Build it with 'make build-tui' or set tui_path in config."
+    )
+
+
+class _Batch:
+    """Messages held back by one TUIBridge.batch() block."""
+
+    __slots__ = ("messages", "open")
+
+    def __init__(self) -> None:
+        self.messages: list[Message] = []
+        self.open = True
+
 
 class TUIBridge(BaseBridge):
     """
@@ -49,55 +110,47 @@ class TUIBridge(BaseBridge):
 
     def __init__(self, config: TUIConfig | None = None):
         self.config = config or TUIConfig()
-        self._process: subprocess.Popen | None = None
+        self._process: asyncio.subprocess.Process | None = None
         self._reader_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
         self._pending_requests: dict[str, asyncio.Future] = {}
-        self._event_queue: asyncio.Queue[Message] = asyncio.Queue()
-        self._outgoing_queue: asyncio.Queue[Message] = asyncio.Queue()
+        # None is the end-of-stream marker that wakes a blocked events() consumer.
+        # Unbounded: the stdout reader must never wait on it, or request
+        # replies queued behind unread events would never be seen.
+        self._event_queue: asyncio.Queue[Message | None] = asyncio.Queue()
+        # None tells the writer to exit once everything before it is written
+        self._outgoing_queue: asyncio.Queue[Message | list[Message] | None] = asyncio.Queue(
+            OUTGOING_QUEUE_SIZE
+        )
+        # The batch() block open in the current task, if any. A context
+        # variable, so sends from other tasks are not swept into it.
+        self._batch: contextvars.ContextVar[_Batch | None] = contextvars.ContextVar(
+            "agentui_tui_batch", default=None
+        )
         self._running = False
         self._shutting_down = False
-        self._lock = asyncio.Lock()
 
     def _find_tui_binary(self) -> str:
         """Find the agentui-tui binary."""
-        if self.config.tui_path:
-            path = Path(self.config.tui_path)
-            if path.exists():
-                return str(path)
-            raise FileNotFoundError(f"TUI binary not found at: {path}")
-
-        # Check common locations
-        candidates = [
-            # Development location (relative to this file)
-            Path(__file__).parent.parent.parent.parent / "bin" / "agentui-tui",
-            # Installed via pip (in package)
-            Path(__file__).parent / "bin" / "agentui-tui",
-            # System PATH
-            "agentui-tui",
-        ]
-
-        for candidate in candidates:
-            if isinstance(candidate, Path):
-                if candidate.exists():
-                    return str(candidate)
-            else:
-                found = shutil.which(str(candidate))
-                if found:
-                    return str(found)
-
-        raise FileNotFoundError(
-            "agentui-tui binary not found. "
-            "Build it with 'make build-tui' or set tui_path in config."
-        )
+        return _resolve_tui_binary(self.config.tui_path)
 
     async def start(self) -> None:
         """Start the TUI subprocess."""
         if self._running:
             return
 
-        async with self._lock:
+        # Claim the bridge before the first await; a concurrent start()
+        # then returns above instead of launching a second process.
+        self._running = True
+
+        # Fresh queues so markers left by a previous stop() are not replayed
+        self._event_queue = asyncio.Queue()
+        self._outgoing_queue = asyncio.Queue(OUTGOING_QUEUE_SIZE)
+        try:
             await self._start_process()
+        except BaseException:
+            self._running = False
+            raise
 
     async def _start_process(self) -> None:
         """Internal method to start the TUI process."""
@@ -113,14 +166,20 @@ class TUIBridge(BaseBridge):
         if self.config.debug:
             logger.info(f"Starting TUI: {' '.join(cmd)}")
 
+        # A reconnect replaces the process: retire the writer bound to the
+        # old one so only one task ever consumes the outgoing queue.
+        writer = self._writer_task
+        if writer is not None and not writer.done():
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+
         try:
-            self._process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
+            self._process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=LINE_LIMIT,
             )
         except OSError as e:
             raise ConnectionError(f"Failed to start TUI process: {e}")
@@ -143,6 +202,7 @@ class TUIBridge(BaseBridge):
 
         self._shutting_down = True
         self._running = False
+        self._close_events()
 
         # Cancel pending requests
         for future in self._pending_requests.values():
@@ -150,25 +210,32 @@ class TUIBridge(BaseBridge):
                 future.cancel()
         self._pending_requests.clear()
 
-        # Cancel tasks
-        for task in [self._reader_task, self._writer_task]:
-            if task and not task.done():
+        # Stop reading; let the writer finish what is already queued
+        if self._reader_task and not self._reader_task.done():
+            self._reader_task.cancel()
+
+        # One shared deadline, which also covers waiting for room for the
+        # end marker; whichever task is still running then is cancelled
+        tasks = [t for t in (self._reader_task, self._writer_task) if t and not t.done()]
+        try:
+            async with asyncio.timeout(1.0):
+                await self._outgoing_queue.put(None)
+                if tasks:
+                    await asyncio.gather(*tasks, return_exceptions=True)
+        except TimeoutError:
+            for task in tasks:
                 task.cancel()
-                try:
-                    await asyncio.wait_for(task, timeout=1.0)
-                except (TimeoutError, asyncio.CancelledError):
-                    pass
 
         # Terminate process
         if self._process:
-            process = self._process  # Capture for type safety in lambda
+            process = self._process
             try:
                 process.terminate()
-                await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: process.wait(timeout=2)
-                )
-            except subprocess.TimeoutExpired:
+                await asyncio.wait_for(process.wait(), timeout=2)
+            except TimeoutError:
                 process.kill()
+            except ProcessLookupError:
+                pass  # Already exited
             except Exception as e:
                 logger.warning(f"Error stopping TUI process: {e}")
             finally:
@@ -179,13 +246,18 @@ class TUIBridge(BaseBridge):
         if not self._process or not self._process.stdout:
             return
 
-        loop = asyncio.get_event_loop()
+        stdout = self._process.stdout
 
         while self._running:
             try:
-                line = await loop.run_in_executor(
-                    None, self._process.stdout.readline
-                )
+                try:
+                    line = await stdout.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    line = e.partial  # EOF; empty unless the last line was unterminated
+                except asyncio.LimitOverrunError:
+                    logger.warning(f"Skipping TUI message longer than {LINE_LIMIT} bytes")
+                    await self._discard_line(stdout)
+                    continue
 
                 if not line:
                     await self._handle_closed_stdout()
@@ -200,19 +272,31 @@ class TUIBridge(BaseBridge):
                     logger.error(f"Error reading from TUI: {e}")
                 break
 
+    @staticmethod
+    async def _discard_line(stdout: asyncio.StreamReader) -> None:
+        """Consume the rest of an over-long line so reading resumes at the next one."""
+        while True:
+            try:
+                await stdout.readuntil(b"\n")
+                return
+            except asyncio.LimitOverrunError as e:
+                await stdout.readexactly(e.consumed)
+            except asyncio.IncompleteReadError:
+                return  # EOF; the next read reports it
+
     async def _handle_closed_stdout(self) -> None:
         """Handle TUI process closing stdout."""
         if not self._shutting_down:
             logger.warning("TUI process closed stdout")
             await self._handle_disconnect()
 
-    async def _process_line(self, line: str) -> None:
+    async def _process_line(self, line: bytes) -> None:
         """Process a single line from TUI stdout."""
         if not line:
             return
 
         if self.config.debug:
-            logger.debug(f"← TUI: {line[:100]}...")
+            logger.debug(f"← TUI: {line[:100].decode(errors='replace')}...")
 
         try:
             msg = Message.from_json(line)
@@ -224,46 +308,63 @@ class TUIBridge(BaseBridge):
 
     async def _route_message(self, msg: Message) -> None:
         """Route message to pending request or event queue."""
-        if msg.id and msg.id in self._pending_requests:
-            future = self._pending_requests.pop(msg.id)
-            if not future.done():
-                future.set_result(msg.payload)
-        else:
-            await self._event_queue.put(msg)
+        # Most traffic is id-less user events; those skip the dict entirely
+        # and responses need a single pop rather than a lookup plus pop.
+        msg_id = msg.id
+        future = self._pending_requests.pop(msg_id, None) if msg_id else None
+        if future is None:
+            self._event_queue.put_nowait(msg)
+        elif not future.done():
+            future.set_result(msg.payload)
+
+    def _close_events(self) -> None:
+        """Wake any events() consumer blocked on an empty queue."""
+        self._event_queue.put_nowait(None)
 
     async def _write_loop(self) -> None:
-        """Write messages to TUI stdin."""
-        while self._running:
-            try:
-                msg = await asyncio.wait_for(
-                    self._outgoing_queue.get(),
-                    timeout=0.1
-                )
-                await self._send_raw(msg)
-            except TimeoutError:
-                continue
-            except asyncio.CancelledError:
+        """
+        Write messages to TUI stdin until the end marker is dequeued.
+
+        Everything already waiting in the queue when the writer wakes up is
+        written together, so a burst of sends costs one write and drain.
+        """
+        queue = self._outgoing_queue
+        while True:
+            item = await queue.get()
+
+            messages: list[Message] = []
+            while item is not None:
+                if isinstance(item, list):
+                    messages.extend(item)
+                else:
+                    messages.append(item)
+                if queue.empty():
+                    break
+                item = queue.get_nowait()
+
+            if messages:
+                try:
+                    await self._send_batch(messages)
+                except Exception as e:
+                    if self._running:
+                        logger.error(f"Error writing to TUI: {e}")
+
+            if item is None:
                 break
-            except Exception as e:
-                if self._running:
-                    logger.error(f"Error writing to TUI: {e}")
 
     async def _stderr_loop(self) -> None:
         """Read and log stderr from TUI."""
         if not self._process or not self._process.stderr:
             return
 
-        loop = asyncio.get_event_loop()
+        stderr = self._process.stderr
 
         while self._running:
             try:
-                line = await loop.run_in_executor(
-                    None, self._process.stderr.readline
-                )
-                if line:
-                    logger.debug(f"TUI stderr: {line.strip()}")
-                elif not self._running:
-                    break
+                line = await stderr.readline()
+                if not line:
+                    break  # EOF; the process has exited
+                logger.debug(f"TUI stderr: {line.decode(errors='replace').strip()}")
             except Exception:
                 break
 
@@ -288,21 +389,28 @@ class TUIBridge(BaseBridge):
 
         logger.error("Failed to reconnect to TUI")
         self._running = False
+        self._close_events()
 
     async def _send_raw(self, message: Message) -> None:
         """Send a message directly to TUI stdin."""
+        await self._write(message.to_bytes() + b"\n")
+
+    async def _send_batch(self, messages: list[Message]) -> None:
+        """Send several messages to TUI stdin with a single write."""
+        await self._write(b"".join(msg.to_bytes() + b"\n" for msg in messages))
+
+    async def _write(self, data: bytes) -> None:
+        """Write serialized JSON lines to TUI stdin and flush."""
         if not self._process or not self._process.stdin:
             raise ConnectionError("TUI not connected")
 
-        line = message.to_json() + "\n"
-
         if self.config.debug:
-            logger.debug(f"→ TUI: {line[:100]}...")
+            logger.debug(f"→ TUI: {data[:100].decode(errors='replace')}...")
 
         try:
-            self._process.stdin.write(line)
-            self._process.stdin.flush()
-        except BrokenPipeError:
+            self._process.stdin.write(data)
+            await self._process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
             raise ConnectionError("TUI connection broken")
         except Exception as e:
             raise ProtocolError(f"Failed to send message: {e}")
@@ -311,7 +419,51 @@ class TUIBridge(BaseBridge):
         """Queue a message to be sent to the TUI."""
         if not self._running:
             raise ConnectionError("TUI not running")
-        await self._outgoing_queue.put(message)
+        batch = self._batch.get()
+        if batch is not None and batch.open:
+            batch.messages.append(message)
+            return
+        try:
+            self._outgoing_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # The writer is behind; wait for it rather than grow the queue
+            await self._outgoing_queue.put(message)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncGenerator[None, None]:
+        """
+        Coalesce messages sent inside the block into a single write.
+
+        Messages are held back until the block exits and then written to
+        the TUI together, in order, as one framed chunk. Nested batches
+        join the outermost one.
+
+        Only sends made by the calling task, and by tasks it starts inside
+        the block, are batched. Other tasks keep sending straight away.
+
+        Example:
+            >>> async with bridge.batch():
+            ...     await bridge.send_alert("Saved", severity="success")
+            ...     await bridge.send_status("Ready")
+        """
+        outer = self._batch.get()
+        if outer is not None and outer.open:
+            yield
+            return
+
+        batch = _Batch()
+        token = self._batch.set(batch)
+        try:
+            yield
+        finally:
+            self._batch.reset(token)
+            # Tasks started in the block may outlive it; they send directly
+            batch.open = False
+            if batch.messages and self._running:
+                try:
+                    self._outgoing_queue.put_nowait(batch.messages)
+                except asyncio.QueueFull:
+                    await self._outgoing_queue.put(batch.messages)
 
     async def send_sync(self, message: Message) -> None:
         """Send a message synchronously (bypass queue)."""
@@ -327,12 +479,13 @@ class TUIBridge(BaseBridge):
         if not self._running:
             raise ConnectionError("TUI not running")
 
-        future = asyncio.get_event_loop().create_future()
+        future = asyncio.get_running_loop().create_future()
         self._pending_requests[message.id] = future
 
         try:
             await self._send_raw(message)
-            return await asyncio.wait_for(future, timeout=timeout)
+            async with asyncio.timeout(timeout):
+                return await future
         except TimeoutError:
             self._pending_requests.pop(message.id, None)
             raise ProtocolError(f"Request timed out after {timeout}s")
@@ -344,15 +497,12 @@ class TUIBridge(BaseBridge):
         """Iterate over user events from the TUI."""
         while self._running:
             try:
-                msg = await asyncio.wait_for(
-                    self._event_queue.get(),
-                    timeout=0.1
-                )
-                yield msg
-            except TimeoutError:
-                continue
+                msg = await self._event_queue.get()
             except asyncio.CancelledError:
                 break
+            if msg is None:
+                break
+            yield msg
 
     @property
     def is_running(self) -> bool:
@@ -363,8 +513,9 @@ class TUIBridge(BaseBridge):
 
     async def send_text(self, content: str, done: bool = False) -> None:
         """Send streaming text."""
-        msg = create_message(MessageType.TEXT, text_payload(content, done))
-        await self.send(msg)
+        # Called once per streamed chunk: build the message directly rather
+        # than going through create_message()'s enum normalisation.
+        await self.send(Message(_TEXT_TYPE, None, text_payload(content, done)))
 
     async def send_markdown(self, content: str, title: str | None = None) -> None:
         """Send markdown content."""
@@ -375,7 +526,7 @@ class TUIBridge(BaseBridge):
         self,
         message: str,
         percent: float | None = None,
-        steps: list[dict] | None = None,
+        steps: Sequence[dict] | None = None,
     ) -> None:
         """Send progress update."""
         msg = create_message(
@@ -386,30 +537,33 @@ class TUIBridge(BaseBridge):
 
     async def request_form(
         self,
-        fields: list[dict],
+        fields: Sequence[UIFormField | dict],
         title: str | None = None,
         description: str | None = None,
     ) -> dict | None:
         """Show a form and wait for response."""
+        # Serialize once here, at the transport boundary
+        wire_fields = [
+            f.to_dict() if isinstance(f, UIFormField) else f for f in fields
+        ]
         msg = create_request(
             MessageType.FORM,
-            form_payload(fields, title, description)
+            form_payload(wire_fields, title, description)
         )
         result = await self.request(msg)
         return result.get("values") if result else None
 
     async def send_table(
         self,
-        columns: list[str],
-        rows: list[list[str]],
+        columns: Sequence[str],
+        rows: Sequence[Sequence[str]],
         title: str | None = None,
         footer: str | None = None,
     ) -> None:
         """Send a data table."""
-        from typing import cast
         msg = create_message(
             MessageType.TABLE,
-            table_payload(cast(list, columns), rows, title, footer)
+            table_payload(columns, rows, title, footer)
         )
         await self.send(msg)
 
@@ -4,8 +4,21 @@ import os
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import IO, Any
 
-import yaml
+
+def load_yaml(source: str | bytes | IO[str]) -> Any:
+    """
+    Parse YAML with PyYAML's safe loader.
+
+    libyaml's C loader is used when PyYAML was built with it, since it
+    parses several times faster. PyYAML is imported here so apps
+    configured in code never load it.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(source, Loader=loader)
 
 
 class ProviderType(str, Enum):
@@ -97,7 +110,7 @@ class AgentConfig:
             yaml.YAMLError: If file is not valid YAML
         """
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
         return cls(**data)
 
 
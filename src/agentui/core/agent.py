@@ -21,7 +21,7 @@ The agent follows this execution flow:
 
 import asyncio
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable, MutableMapping
 from typing import Any
 
 from agentui.bridge import CLIBridge, TUIBridge
@@ -33,6 +33,7 @@ from agentui.core.ui_handler import UIHandler
 from agentui.exceptions import (
     BridgeError,
     ConfigurationError,
+    ProviderError,
 )
 from agentui.protocol import MessageType
 from agentui.types import AgentConfig, AgentState, StreamChunk, ToolDefinition, ToolResult
@@ -109,17 +110,44 @@ class AgentCore:
         """
         self.tool_executor.register_tool(tool)
 
-    def get_tool_schemas(self) -> list[dict]:
+    def register_tools(self, tools: Iterable[ToolDefinition]) -> None:
+        """
+        Register several tools for the agent to use.
+
+        Args:
+            tools: ToolDefinitions to register; a later tool replaces an
+                earlier one with the same name
+        """
+        self.tool_executor.register_tools(tools)
+
+    def unregister_tool(self, name: str) -> None:
+        """
+        Remove a tool so the agent no longer offers it to the LLM.
+
+        Args:
+            name: Name of the registered tool
+
+        Raises:
+            KeyError: If no tool with that name is registered
+        """
+        self.tool_executor.unregister_tool(name)
+
+    def reset_state(self) -> None:
+        """Start a new conversation: empty message history and token counts."""
+        self.state = AgentState()
+        self.message_handler.state = self.state
+
+    def get_tool_schemas(self) -> tuple[dict, ...]:
         """
         Get tool schemas for the LLM.
 
         Returns:
-            List of tool schema dictionaries in Anthropic format
+            Tuple of tool schema dictionaries in Anthropic format
         """
         return self.tool_executor.get_tool_schemas()
 
     @property
-    def tools(self) -> dict:
+    def tools(self) -> MutableMapping[str, ToolDefinition]:
         """Get registered tools (for backward compatibility)."""
         return self.tool_executor.tools
 
@@ -165,6 +193,23 @@ class AgentCore:
         self.config.system_prompt = enhanced_prompt
         logger.debug("Enhanced system prompt with component catalog")
 
+    @property
+    def provider(self) -> Any:
+        """The LLM provider in use, or None until one is created or set."""
+        return self._provider
+
+    def set_provider(self, provider: Any) -> None:
+        """
+        Use an existing LLM provider instead of creating one from config.
+
+        Lets several agents share one provider, and with it the SDK client
+        and its connection pool.
+
+        Args:
+            provider: A ClaudeProvider, OpenAIProvider or compatible object
+        """
+        self._provider = provider
+
     async def _get_provider(self) -> Any:
         """Get or create the LLM provider."""
         if self._provider is None:
@@ -193,6 +238,25 @@ class AgentCore:
 
         return self._provider
 
+    async def warm_up(self) -> None:
+        """
+        Build the LLM provider client ahead of the first message.
+
+        Importing the provider SDK and constructing its client is slow
+        enough to delay the first response noticeably, so callers can run
+        this as a task that overlaps other startup, such as spawning the
+        TUI. A missing SDK or API key is logged as a warning here and
+        raised again by process_message() when the provider is needed.
+        """
+        try:
+            provider = await self._get_provider()
+            # Providers given to set_provider() need not implement it
+            warm_up = getattr(provider, "warm_up", None)
+            if warm_up is not None:
+                await warm_up()
+        except (ImportError, ConfigurationError, ProviderError) as e:
+            logger.warning(f"Provider warm-up failed: {e}")
+
     async def execute_tool(
         self, tool_name: str, tool_id: str, arguments: dict
     ) -> ToolResult:
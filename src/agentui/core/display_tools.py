@@ -5,7 +5,7 @@ Auto-registers display_* tools for UI primitives (Generative UI Phase 1).
 """
 
 import logging
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from agentui.component_catalog import ComponentCatalog
@@ -25,6 +25,16 @@ class DisplayToolRegistry:
             bridge_getter: Optional callable that returns the current bridge
         """
         self._bridge_getter = bridge_getter
+        # display_* type -> renderer, built once instead of an if/elif chain per call
+        self._display_handlers: dict[str, Callable[[Any, dict], Awaitable[Any]]] = {
+            "form": self._display_form,
+            "confirm": self._display_confirm,
+            "select": self._display_select,
+            "table": self._display_table,
+            "code": self._display_code,
+            "progress": self._display_progress,
+            "alert": self._display_alert,
+        }
 
     @property
     def bridge(self) -> Any:
@@ -75,12 +85,12 @@ class DisplayToolRegistry:
         The handler sends the appropriate UI message via the bridge.
         """
 
+        msg_type = tool_name.replace("display_", "")
+
         async def handler(**kwargs: Any) -> Any:
             if not self.bridge:
                 return f"[Would display {tool_name} with: {kwargs}]"
 
-            msg_type = tool_name.replace("display_", "")
-
             try:
                 return await self._execute_display_message(msg_type, kwargs)
             except BridgeError as e:
@@ -95,60 +105,65 @@ class DisplayToolRegistry:
         if not bridge:
             raise ConfigurationError("Bridge not available for display messages")
 
-        # Interactive messages that return data
-        if msg_type == "form":
-            return await bridge.request_form(
-                fields=kwargs.get("fields", []),
-                title=kwargs.get("title"),
-                description=kwargs.get("description"),
-            )
-
-        if msg_type == "confirm":
-            return await bridge.request_confirm(
-                message=kwargs["message"],
-                title=kwargs.get("title"),
-                destructive=kwargs.get("destructive", False),
-            )
-
-        if msg_type == "select":
-            return await bridge.request_select(
-                label=kwargs["label"],
-                options=kwargs["options"],
-                default=kwargs.get("default"),
-            )
-
-        # Non-interactive display messages
-        if msg_type == "table":
-            await bridge.send_table(
-                columns=kwargs["columns"],
-                rows=kwargs["rows"],
-                title=kwargs.get("title"),
-                footer=kwargs.get("footer"),
-            )
-            return f"Displayed table: {kwargs.get('title', 'Table')}"
-
-        if msg_type == "code":
-            await bridge.send_code(
-                code=kwargs["code"],
-                language=kwargs.get("language", "text"),
-                title=kwargs.get("title"),
-            )
-            return f"Displayed code: {kwargs.get('title', 'Code')}"
-
-        if msg_type == "progress":
-            await bridge.send_progress(
-                message=kwargs["message"],
-                percent=kwargs.get("percent"),
-                steps=kwargs.get("steps"),
-            )
-            return f"Displayed progress: {kwargs['message']}"
-
-        if msg_type == "alert":
-            await bridge.send_alert(
-                message=kwargs["message"],
-                severity=kwargs.get("severity", "info"),
-                title=kwargs.get("title"),
-            )
-            return f"Displayed alert: {kwargs['message']}"
-
-        return f"Unknown display type: {msg_type}"
+        display = self._display_handlers.get(msg_type)
+        if display is None:
+            return f"Unknown display type: {msg_type}"
+        return await display(bridge, kwargs)
+
+    # Interactive messages that return data
+
+    async def _display_form(self, bridge: Any, kwargs: dict) -> Any:
+        return await bridge.request_form(
+            fields=kwargs.get("fields", []),
+            title=kwargs.get("title"),
+            description=kwargs.get("description"),
+        )
+
+    async def _display_confirm(self, bridge: Any, kwargs: dict) -> Any:
+        return await bridge.request_confirm(
+            message=kwargs["message"],
+            title=kwargs.get("title"),
+            destructive=kwargs.get("destructive", False),
+        )
+
+    async def _display_select(self, bridge: Any, kwargs: dict) -> Any:
+        return await bridge.request_select(
+            label=kwargs["label"],
+            options=kwargs["options"],
+            default=kwargs.get("default"),
+        )
+
+    # Non-interactive display messages
+
+    async def _display_table(self, bridge: Any, kwargs: dict) -> str:
+        await bridge.send_table(
+            columns=kwargs["columns"],
+            rows=kwargs["rows"],
+            title=kwargs.get("title"),
+            footer=kwargs.get("footer"),
+        )
+        return f"Displayed table: {kwargs.get('title', 'Table')}"
+
+    async def _display_code(self, bridge: Any, kwargs: dict) -> str:
+        await bridge.send_code(
+            code=kwargs["code"],
+            language=kwargs.get("language", "text"),
+            title=kwargs.get("title"),
+        )
+        return f"Displayed code: {kwargs.get('title', 'Code')}"
+
+    async def _display_progress(self, bridge: Any, kwargs: dict) -> str:
+        await bridge.send_progress(
+            message=kwargs["message"],
+            percent=kwargs.get("percent"),
+            steps=kwargs.get("steps"),
+        )
+        return f"Displayed progress: {kwargs['message']}"
+
+    async def _display_alert(self, bridge: Any, kwargs: dict) -> str:
+        await bridge.send_alert(
+            message=kwargs["message"],
+            severity=kwargs.get("severity", "info"),
+            title=kwargs.get("title"),
+        )
+        return f"Displayed alert: {kwargs['message']}"
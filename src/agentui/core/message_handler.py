@@ -5,6 +5,7 @@ Handles LLM response streaming, tool call collection, and message state manageme
 """
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 from agentui.types import AgentState, Message, StreamChunk
@@ -37,7 +38,7 @@ class MessageHandler:
         return self._cancel_requested
 
     async def stream_provider_response(
-        self, provider: Any, system_prompt: str, tool_schemas: list[dict] | None
+        self, provider: Any, system_prompt: str, tool_schemas: Sequence[dict] | None
     ) -> tuple[list[StreamChunk], list[dict], bool]:
         """
         Stream response from provider and collect chunks and tool calls.
@@ -6,7 +6,7 @@ Manages tool registration, execution, confirmation, and component selection.
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
 from typing import Any
 
 from agentui.component_selector import ComponentSelector
@@ -27,6 +27,38 @@ from agentui.types import ToolDefinition, ToolResult
 logger = logging.getLogger(__name__)
 
 
+class _ToolsView(MutableMapping[str, ToolDefinition]):
+    """Writable view of a ToolExecutor's tools that keeps its schema cache in step."""
+
+    __slots__ = ("_executor",)
+
+    def __init__(self, executor: "ToolExecutor"):
+        self._executor = executor
+
+    def __getitem__(self, name: str) -> ToolDefinition:
+        return self._executor._tools[name]
+
+    def __setitem__(self, name: str, tool: ToolDefinition) -> None:
+        self._executor._tools[name] = tool
+        self._executor._schemas = None
+
+    def __delitem__(self, name: str) -> None:
+        del self._executor._tools[name]
+        self._executor._schemas = None
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._executor._tools
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._executor._tools)
+
+    def __len__(self) -> int:
+        return len(self._executor._tools)
+
+    def __repr__(self) -> str:
+        return repr(self._executor._tools)
+
+
 class ToolExecutor:
     """Handles tool execution and result processing."""
 
@@ -36,9 +68,21 @@ class ToolExecutor:
         Args:
             bridge_getter: Optional callable that returns the current bridge
         """
-        self.tools: dict[str, ToolDefinition] = {}
+        self._tools: dict[str, ToolDefinition] = {}
+        self._schemas: tuple[dict, ...] | None = None
+        self._tools_view = _ToolsView(self)
         self._bridge_getter = bridge_getter
 
+    @property
+    def tools(self) -> MutableMapping[str, ToolDefinition]:
+        """Registered tools by name; changes made here also refresh the schemas."""
+        return self._tools_view
+
+    @tools.setter
+    def tools(self, tools: Mapping[str, ToolDefinition]) -> None:
+        self._tools = dict(tools)
+        self._schemas = None
+
     @property
     def bridge(self) -> Any:
         """Get the current bridge."""
@@ -46,24 +90,47 @@ class ToolExecutor:
 
     def register_tool(self, tool: ToolDefinition) -> None:
         """Register a tool for execution."""
-        self.tools[tool.name] = tool
-        logger.debug(f"Registered tool: {tool.name}")
+        self._tools[tool.name] = tool
+        self._schemas = None
+        logger.debug("Registered tool: %s", tool.name)
+
+    def register_tools(self, tools: Iterable[ToolDefinition]) -> None:
+        """Register several tools for execution in one update."""
+        by_name = {tool.name: tool for tool in tools}
+        self._tools.update(by_name)
+        self._schemas = None
+        logger.debug("Registered tools: %s", ", ".join(by_name))
+
+    def unregister_tool(self, name: str) -> None:
+        """Remove a registered tool.
+
+        Raises:
+            KeyError: If no tool with that name is registered
+        """
+        del self._tools[name]
+        self._schemas = None
+        logger.debug("Unregistered tool: %s", name)
 
-    def get_tool_schemas(self) -> list[dict]:
-        """Get tool schemas for the LLM."""
-        return [tool.to_schema() for tool in self.tools.values()]
+    def get_tool_schemas(self) -> tuple[dict, ...]:
+        """Get tool schemas for the LLM.
+
+        The tuple is built once and reused until the registered tools change.
+        """
+        if self._schemas is None:
+            self._schemas = tuple(tool.to_schema() for tool in self._tools.values())
+        return self._schemas
 
     async def execute_tool(
         self, tool_name: str, tool_id: str, arguments: dict
     ) -> ToolResult:
         """Execute a tool and return the result."""
-        if tool_name not in self.tools:
+        tool = self._tools.get(tool_name)
+        if tool is None:
             return self._create_error_result(
                 tool_name, tool_id, f"Unknown tool: {tool_name}"
             )
 
-        tool = self.tools[tool_name]
-        logger.debug(f"Executing tool: {tool_name} with args: {arguments}")
+        logger.debug("Executing tool: %s with args: %s", tool_name, arguments)
 
         # Check if confirmation is required
         if not await self._confirm_tool_execution(tool_name, tool):
@@ -78,7 +145,7 @@ class ToolExecutor:
             result = await self._execute_tool_handler(tool, arguments)
             result, is_ui = self._apply_component_selection(tool, result, tool_name)
 
-            logger.debug(f"Tool {tool_name} completed successfully")
+            logger.debug("Tool %s completed successfully", tool_name)
 
             return ToolResult(
                 tool_name=tool_name,
@@ -134,7 +201,7 @@ class ToolExecutor:
             return await tool.handler(**arguments)
 
         # Run sync function in executor
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: tool.handler(**arguments))
 
     def _apply_component_selection(
@@ -163,7 +230,7 @@ class ToolExecutor:
                 ui_primitive, UITable | UICode | UIMarkdown
             ):
                 logger.debug(
-                    f"Auto-selected component: {component_type} for tool {tool_name}"
+                    "Auto-selected component: %s for tool %s", component_type, tool_name
                 )
                 result = ui_primitive
                 is_ui = True
@@ -45,7 +45,7 @@ class UIHandler:
         try:
             if isinstance(result, UIForm):
                 return await self.bridge.request_form(
-                    fields=[f.to_dict() for f in result.fields],
+                    fields=result.fields,
                     title=result.title,
                     description=result.description,
                 )
@@ -54,11 +54,12 @@ Example:
     ...     )
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class UIFormField:
     """
     A single field in a UIForm.
@@ -120,7 +121,7 @@ class UIFormField:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class UIForm:
     """
     A multi-field form for collecting structured user input.
@@ -175,7 +176,7 @@ class UIForm:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UIProgressStep:
     """
     A single step in a multi-step progress indicator.
@@ -197,7 +198,7 @@ class UIProgressStep:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class UIProgress:
     """
     Progress indicator for long-running operations.
@@ -240,7 +241,7 @@ class UIProgress:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class UITable:
     """
     A data table with columns and rows.
@@ -249,8 +250,9 @@ class UITable:
     Perfect for showing structured data, query results, or comparisons.
 
     Attributes:
-        columns: List of column headers
-        rows: List of rows, where each row is a list of cell values (as strings)
+        columns: Column headers
+        rows: Rows, each a sequence of cell values (as strings); tuples such
+            as database cursor results can be passed without converting
         title: Optional table title
         footer: Optional footer text (e.g., row count, summary)
 
@@ -266,13 +268,15 @@ class UITable:
         ...     footer="3 users found"
         ... )
     """
-    columns: list[str]
-    rows: list[list[str]]
+    columns: Sequence[str]
+    rows: Sequence[Sequence[str]]
     title: str | None = None
     footer: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to protocol dictionary for JSON serialization."""
+        # Rows are passed through as-is; the protocol encoder serializes any
+        # list or tuple rows directly, so no per-row copy is made here.
         d: dict[str, Any] = {"columns": self.columns, "rows": self.rows}
         if self.title:
             d["title"] = self.title
@@ -281,7 +285,7 @@ class UITable:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class UICode:
     """
     A syntax-highlighted code block.
@@ -319,7 +323,7 @@ class UICode:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class UIConfirm:
     """
     A yes/no confirmation dialog.
@@ -365,7 +369,7 @@ class UIConfirm:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class UISelect:
     """
     A selection menu for choosing from a list of options.
@@ -390,7 +394,7 @@ class UISelect:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class UIAlert:
     """
     A notification alert with severity levels.
@@ -414,7 +418,7 @@ class UIAlert:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class UIText:
     """
     Plain text content for streaming responses.
@@ -431,7 +435,7 @@ class UIText:
         return {"content": self.content, "done": self.done}
 
 
-@dataclass
+@dataclass(slots=True)
 class UIMarkdown:
     """
     Rendered markdown content.
@@ -451,7 +455,7 @@ class UIMarkdown:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class UIInput:
     """
     A single text input field.
@@ -473,7 +477,7 @@ class UIInput:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class UISpinner:
     """
     A loading spinner indicator.
@@ -1,16 +1,88 @@
 """
 Protocol handling for communication with Go TUI.
 
-JSON Lines protocol over stdio.
+JSON Lines protocol over stdio. Messages are encoded with msgspec when it is
+installed (``pip install agentui[fast]``), then orjson if that is available,
+and the stdlib json module otherwise; all produce the same compact JSON.
 """
 
+import functools
+import importlib
 import json
 import uuid
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import Enum
+from types import ModuleType
 from typing import Any, Literal
 
 
+def _import_backend(name: str) -> ModuleType | None:
+    """Import an optional JSON backend, or return None if it isn't installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# Imported by name so type checking does not depend on which are installed
+msgspec = _import_backend("msgspec")
+orjson = _import_backend("orjson") if msgspec is None else None
+
+
+def _decode_error(exc: Exception, line: str | bytes) -> json.JSONDecodeError:
+    """Wrap a backend error in the stdlib type so callers handle all backends alike."""
+    if isinstance(line, bytes):
+        line = line.decode(errors="replace")
+    return json.JSONDecodeError(str(exc), line, 0)
+
+
+# Encode a message dict to UTF-8 JSON bytes / parse one JSON line
+_Encoder = Callable[[dict[str, Any]], bytes]
+_Decoder = Callable[[str | bytes], Any]
+
+_dumpb: _Encoder
+_loads: _Decoder
+
+if msgspec is not None:
+    _msgspec_decode_errors = (msgspec.DecodeError, UnicodeDecodeError)
+    _encoder = msgspec.json.Encoder()
+    _decoder = msgspec.json.Decoder()
+
+    _dumpb = _encoder.encode
+
+    def _msgspec_loads(line: str | bytes) -> Any:
+        try:
+            return _decoder.decode(line)
+        except _msgspec_decode_errors as e:
+            raise _decode_error(e, line) from e
+
+    _loads = _msgspec_loads
+elif orjson is not None:
+    # Non-str keys are stringified, matching the stdlib encoder
+    _dumpb = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+
+    # orjson.JSONDecodeError already subclasses json.JSONDecodeError
+    _loads = orjson.loads
+else:
+    def _json_dumpb(data: dict[str, Any]) -> bytes:
+        # Compact separators: no padding bytes on the wire, same as msgspec
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def _json_loads(line: str | bytes) -> Any:
+        try:
+            return json.loads(line)
+        except UnicodeDecodeError as e:
+            raise _decode_error(e, line) from e
+
+    _dumpb = _json_dumpb
+    _loads = _json_loads
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    return _dumpb(data).decode()
+
+
 class MessageType(str, Enum):
     """Message types for the protocol."""
     # Python → Go (render commands)
@@ -40,26 +112,41 @@ class MessageType(str, Enum):
     RESIZE = "resize"
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Base message for protocol communication."""
     type: str
     id: str | None = None
     payload: dict | None = None
 
-    def to_json(self) -> str:
-        """Serialize to JSON line."""
+    def _to_dict(self) -> dict[str, Any]:
+        """Build the wire representation, omitting empty fields."""
         data: dict[str, Any] = {"type": self.type}
         if self.id:
             data["id"] = self.id
         if self.payload:
             data["payload"] = self.payload
-        return json.dumps(data)
+        return data
+
+    def to_json(self) -> str:
+        """Serialize to JSON line."""
+        return _dumps(self._to_dict())
+
+    def to_bytes(self) -> bytes:
+        """Serialize to UTF-8 encoded JSON, ready to write to a pipe."""
+        return _dumpb(self._to_dict())
 
     @classmethod
-    def from_json(cls, line: str) -> "Message":
-        """Deserialize from JSON line."""
-        data = json.loads(line)
+    def from_json(cls, line: str | bytes) -> "Message":
+        """
+        Deserialize from JSON line.
+
+        Bytes are parsed as UTF-8 without first being decoded to ``str``.
+
+        Raises:
+            json.JSONDecodeError: If the line is not valid UTF-8 JSON
+        """
+        data = _loads(line)
         return cls(
             type=data.get("type", ""),
             id=data.get("id"),
@@ -85,7 +172,7 @@ def markdown_payload(content: str, title: str | None = None) -> dict[str, Any]:
 def progress_payload(
     message: str,
     percent: float | None = None,
-    steps: list[dict] | None = None,
+    steps: Sequence[dict] | None = None,
 ) -> dict[str, Any]:
     """Create progress payload."""
     payload: dict[str, Any] = {"message": message}
@@ -144,8 +231,8 @@ def form_field(
 
 
 def table_payload(
-    columns: list[str | dict],
-    rows: list[list[str]],
+    columns: Sequence[str | dict],
+    rows: Sequence[Sequence[str]],
     title: str | None = None,
     footer: str | None = None,
 ) -> dict[str, Any]:
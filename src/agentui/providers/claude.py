@@ -3,7 +3,7 @@ Claude Provider - Anthropic Claude integration.
 """
 
 import os
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 
 from agentui.exceptions import ProviderError
 
@@ -27,6 +27,7 @@ class ClaudeProvider:
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.max_tokens = max_tokens
         self._client = None
+        self._converted_tools: tuple[tuple[dict, ...], list[dict]] | None = None
 
     def _get_client(self) -> object:
         """Get or create the Anthropic client."""
@@ -49,11 +50,25 @@ class ClaudeProvider:
 
         return self._client
 
+    async def warm_up(self) -> None:
+        """
+        Create the Anthropic client ahead of the first request.
+
+        Importing the SDK is slow, so the work runs in a worker thread.
+
+        Raises:
+            ImportError: If the SDK is not installed
+            ProviderError: If no API key is configured
+        """
+        import asyncio
+
+        await asyncio.to_thread(self._get_client)
+
     async def stream_message(
         self,
         messages: list[dict],
         system: str | None = None,
-        tools: list[dict] | None = None,
+        tools: Sequence[dict] | None = None,
     ) -> AsyncIterator[dict]:
         """
         Stream a message response.
@@ -72,7 +87,7 @@ class ClaudeProvider:
         request = self._build_request(messages, system, tools)
 
         # Stream response using sync client in executor
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         events = await loop.run_in_executor(
             None, lambda: list(self._stream_sync(client, request))
         )
@@ -88,7 +103,7 @@ class ClaudeProvider:
         self,
         messages: list[dict],
         system: str | None,
-        tools: list[dict] | None,
+        tools: Sequence[dict] | None,
     ) -> dict:
         """Build request payload for Anthropic API."""
         request = {
@@ -231,9 +246,19 @@ class ClaudeProvider:
 
         return result
 
-    def _convert_tools(self, tools: list[dict]) -> list[dict]:
-        """Convert tools to Anthropic format."""
-        return [
+    def _convert_tools(self, tools: Sequence[dict]) -> list[dict]:
+        """
+        Convert tools to Anthropic format.
+
+        The result is reused for as long as the same schema tuple is passed
+        in, which AgentCore does until its registered tools change. Other
+        sequences could be changed in place, so they are converted anew.
+        """
+        cached = self._converted_tools
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+
+        converted = [
             {
                 "name": tool["name"],
                 "description": tool["description"],
@@ -241,3 +266,6 @@ class ClaudeProvider:
             }
             for tool in tools
         ]
+        if isinstance(tools, tuple):
+            self._converted_tools = (tools, converted)
+        return converted
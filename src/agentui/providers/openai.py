@@ -4,7 +4,7 @@ OpenAI Provider - OpenAI GPT integration.
 
 import json
 import os
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 
 from agentui.exceptions import ProviderError
 
@@ -28,6 +28,7 @@ class OpenAIProvider:
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.max_tokens = max_tokens
         self._client = None
+        self._converted_tools: tuple[tuple[dict, ...], list[dict]] | None = None
 
     def _get_client(self) -> object:
         """Get or create the OpenAI client."""
@@ -50,11 +51,25 @@ class OpenAIProvider:
 
         return self._client
 
+    async def warm_up(self) -> None:
+        """
+        Create the OpenAI client ahead of the first request.
+
+        Importing the SDK is slow, so the work runs in a worker thread.
+
+        Raises:
+            ImportError: If the SDK is not installed
+            ProviderError: If no API key is configured
+        """
+        import asyncio
+
+        await asyncio.to_thread(self._get_client)
+
     async def stream_message(
         self,
         messages: list[dict],
         system: str | None = None,
-        tools: list[dict] | None = None,
+        tools: Sequence[dict] | None = None,
     ) -> AsyncIterator[dict]:
         """
         Stream a message response.
@@ -73,7 +88,7 @@ class OpenAIProvider:
         request = self._build_request(messages, system, tools)
 
         # Stream response
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         events = await loop.run_in_executor(
             None, lambda: list(self._stream_sync(client, request))
         )
@@ -97,7 +112,7 @@ class OpenAIProvider:
         self,
         messages: list[dict],
         system: str | None,
-        tools: list[dict] | None,
+        tools: Sequence[dict] | None,
     ) -> dict:
         """Build request payload for OpenAI API."""
         all_messages = []
@@ -232,9 +247,19 @@ class OpenAIProvider:
 
         return result
 
-    def _convert_tools(self, tools: list[dict]) -> list[dict]:
-        """Convert tools to OpenAI format."""
-        return [
+    def _convert_tools(self, tools: Sequence[dict]) -> list[dict]:
+        """
+        Convert tools to OpenAI format.
+
+        The result is reused for as long as the same schema tuple is passed
+        in, which AgentCore does until its registered tools change. Other
+        sequences could be changed in place, so they are converted anew.
+        """
+        cached = self._converted_tools
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+
+        converted = [
             {
                 "type": "function",
                 "function": {
@@ -245,3 +270,6 @@ class OpenAIProvider:
             }
             for tool in tools
         ]
+        if isinstance(tools, tuple):
+            self._converted_tools = (tools, converted)
+        return converted
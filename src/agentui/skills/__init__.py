@@ -11,8 +11,7 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any, cast
 
-import yaml
-
+from agentui.config import load_yaml
 from agentui.exceptions import SkillLoadError
 from agentui.types import ToolDefinition
 
@@ -63,8 +62,7 @@ class Skill:
         # Load skill.yaml
         skill_yaml = path / "skill.yaml"
         if skill_yaml.exists():
-            with open(skill_yaml) as f:
-                config = yaml.safe_load(f) or {}
+            config = load_yaml(skill_yaml.read_bytes()) or {}
 
             # Extract tool definitions and validate they have handlers
             for tool_def in config.get("tools", []):
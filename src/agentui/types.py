@@ -31,7 +31,7 @@ __all__ = ["ProviderType", "AgentConfig", "TUIConfig", "ToolDefinition", "Messag
            "ToolResult", "AgentState", "StreamChunk", "AppManifest"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolDefinition:
     """
     Definition of a callable tool for LLM use.
@@ -318,7 +318,7 @@ class TUIRenderer(Renderer):
         """Render an interactive form and wait for submission."""
         # This would mount a form widget and wait for response
         # For now, return a placeholder
-        self._pending_response = asyncio.get_event_loop().create_future()
+        self._pending_response = asyncio.get_running_loop().create_future()
 
         # Tell app to show form
         if self.app:
@@ -331,7 +331,7 @@ class TUIRenderer(Renderer):
 
     async def _render_confirm(self, confirm: UIConfirm) -> bool:
         """Render a confirmation dialog."""
-        self._pending_response = asyncio.get_event_loop().create_future()
+        self._pending_response = asyncio.get_running_loop().create_future()
 
         if self.app:
             self.app.show_confirm(confirm, self._pending_response)
@@ -342,7 +342,7 @@ class TUIRenderer(Renderer):
 
     async def _render_input(self, input_prim: UIInput) -> str:
         """Render a text input."""
-        self._pending_response = asyncio.get_event_loop().create_future()
+        self._pending_response = asyncio.get_running_loop().create_future()
 
         if self.app:
             self.app.show_input(input_prim, self._pending_response)
@@ -353,7 +353,7 @@ class TUIRenderer(Renderer):
 
     async def _render_select(self, select: UISelect) -> str:
         """Render a selection."""
-        self._pending_response = asyncio.get_event_loop().create_future()
+        self._pending_response = asyncio.get_running_loop().create_future()
 
         if self.app:
             self.app.show_select(select, self._pending_response)
@@ -2,16 +2,30 @@
 Tests for the app module (AgentApp).
 """
 
+import asyncio
 import os
 import tempfile
+from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import yaml
 
-from agentui.app import AgentApp, create_app, quick_chat
-from agentui.types import AgentConfig, AppManifest, ProviderType, ToolDefinition
+from agentui.app import (
+    _QUICK_CHAT_PROVIDERS,
+    QUICK_CHAT_PROVIDER_LIMIT,
+    AgentApp,
+    clear_quick_chat_providers,
+    create_app,
+    quick_chat,
+)
+from agentui.types import (
+    AgentConfig,
+    AppManifest,
+    ProviderType,
+    ToolDefinition,
+)
 
 
 @pytest.fixture
@@ -130,6 +144,35 @@ class TestAgentAppInitialization:
         with pytest.raises(FileNotFoundError, match="Manifest not found"):
             AgentApp(manifest="/nonexistent/path/app.yaml")
 
+    def test_manifest_parse_is_cached(self, temp_manifest_file):
+        """Test that an unchanged manifest file is only parsed once."""
+        AgentApp(manifest=temp_manifest_file)
+
+        with patch("yaml.load") as mock_load:
+            app = AgentApp(manifest=temp_manifest_file)
+            mock_load.assert_not_called()
+
+        assert app.manifest.name == "test-agent"
+
+    def test_manifest_cache_returns_copies(self, temp_manifest_file):
+        """Test that apps sharing a manifest file do not share its state."""
+        first = AgentApp(manifest=temp_manifest_file)
+        first.manifest.skills.append("./skills/extra")
+
+        second = AgentApp(manifest=temp_manifest_file)
+        assert second.manifest.skills == []
+
+    def test_manifest_cache_invalidated_on_change(self, temp_manifest_file):
+        """Test that editing the manifest file is picked up."""
+        AgentApp(manifest=temp_manifest_file)
+
+        data = yaml.safe_load(temp_manifest_file.read_text())
+        data["name"] = "renamed-agent"
+        temp_manifest_file.write_text(yaml.dump(data))
+
+        app = AgentApp(manifest=temp_manifest_file)
+        assert app.manifest.name == "renamed-agent"
+
     def test_debug_mode_enables_logging(self, mock_api_key):
         """Test that debug=True enables debug logging."""
         with patch("logging.basicConfig") as mock_logging:
@@ -162,6 +205,14 @@ class TestAgentAppApiKeys:
         assert app.config.api_key == "test-gemini-key"
         os.environ.pop("GOOGLE_API_KEY", None)
 
+    def test_get_api_key_with_provider_enum(self):
+        """Test API key retrieval when the provider is passed as an enum."""
+        os.environ["OPENAI_API_KEY"] = "test-openai-key"
+        app = AgentApp(name="test", provider=ProviderType.OPENAI)
+        assert app.config.provider is ProviderType.OPENAI
+        assert app.config.api_key == "test-openai-key"
+        os.environ.pop("OPENAI_API_KEY", None)
+
     def test_explicit_api_key_overrides_env(self):
         """Test that explicitly provided API key overrides environment."""
         os.environ["ANTHROPIC_API_KEY"] = "env-key"
@@ -328,6 +379,20 @@ class TestAgentAppChat:
             # Core should only be created once
             MockCore.assert_called_once()
 
+    def test_core_not_created_until_needed(self, mock_api_key):
+        """Test that registering tools does not build the core."""
+        app = AgentApp(name="TestAgent")
+
+        @app.tool("test_tool", "Test", {"type": "object"})
+        def test_tool():
+            return "result"
+
+        assert app._core is None
+
+        core = app._ensure_core()
+        assert "test_tool" in core.tools
+        assert app._ensure_core() is core
+
     @pytest.mark.asyncio
     async def test_chat_registers_tools(self, mock_api_key):
         """Test that chat() registers tools with the core."""
@@ -340,7 +405,7 @@ class TestAgentAppChat:
         with patch("agentui.app.AgentCore") as MockCore:
             mock_core = MagicMock()
             MockCore.return_value = mock_core
-            mock_core.register_tool = MagicMock()
+            mock_core.register_tools = MagicMock()
 
             async def mock_process(message):
                 yield MagicMock(content="Response", is_complete=True)
@@ -350,9 +415,9 @@ class TestAgentAppChat:
             await app.chat("Test message")
 
             # Verify tool was registered
-            mock_core.register_tool.assert_called_once()
-            registered_tool = mock_core.register_tool.call_args[0][0]
-            assert registered_tool.name == "test_tool"
+            mock_core.register_tools.assert_called_once()
+            registered_tools = list(mock_core.register_tools.call_args[0][0])
+            assert [t.name for t in registered_tools] == ["test_tool"]
 
     @pytest.mark.asyncio
     async def test_chat_accumulates_response(self, mock_api_key):
@@ -376,6 +441,134 @@ class TestAgentAppChat:
             assert response == "Hello World!"
 
 
+class TestAgentAppRun:
+    """Tests for interactive run()."""
+
+    @pytest.mark.asyncio
+    async def test_initial_prompt_text_precedes_tool_ui(self, mock_api_key):
+        """Test that streamed text reaches the bridge before UI a tool renders next."""
+        app = AgentApp(name="TestAgent")
+        calls = []
+        bridge = MagicMock()
+        bridge.send_text = AsyncMock(side_effect=lambda text, done: calls.append(text))
+        bridge.send_table = AsyncMock(side_effect=lambda *a, **k: calls.append("<table>"))
+        bridge.send_done = AsyncMock()
+
+        @asynccontextmanager
+        async def fake_bridge(*args, **kwargs):
+            yield bridge
+
+        async def process(message):
+            yield MagicMock(content="Here are the results:", is_complete=False)
+            yield MagicMock(content="", is_complete=False)  # keep-alive, not sent
+            await bridge.send_table(["a"], [["1"]])  # a UI tool runs mid-stream
+            yield MagicMock(content=" Done.", is_complete=True)
+
+        with patch("agentui.app.AgentCore") as MockCore, \
+                patch("agentui.app.managed_bridge", fake_bridge):
+            core = MockCore.return_value
+            core.warm_up = AsyncMock()
+            core.run_loop = AsyncMock()
+            core.process_message = process
+
+            await app.run(prompt="Show results")
+
+        assert calls == ["Here are the results:", "<table>", " Done."]
+
+    @pytest.mark.asyncio
+    async def test_warm_up_cancelled_when_bridge_fails(self, mock_api_key):
+        """Test that a failed bridge start does not leave warm-up running."""
+        import asyncio
+
+        app = AgentApp(name="TestAgent")
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow_warm_up():
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        @asynccontextmanager
+        async def failing_bridge(*args, **kwargs):
+            await started.wait()
+            raise RuntimeError("no terminal")
+            yield
+
+        with patch("agentui.app.AgentCore") as MockCore, \
+                patch("agentui.app.managed_bridge", failing_bridge):
+            MockCore.return_value.warm_up = slow_warm_up
+
+            with pytest.raises(RuntimeError, match="no terminal"):
+                await app.run()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+    @pytest.mark.asyncio
+    async def test_run_after_chat_sees_new_tools_and_fresh_history(self, mock_api_key):
+        """Test that run() reuses a chat() core without its history or stale tools."""
+        app = AgentApp(name="TestAgent")
+        seen = {}
+
+        @asynccontextmanager
+        async def fake_bridge(*args, **kwargs):
+            yield MagicMock()
+
+        async def run_loop():
+            seen["tools"] = set(app._core.tools)
+            seen["messages"] = list(app._core.state.messages)
+
+        core = app._ensure_core()
+        core.state.messages.append(MagicMock(role="user", content="from chat"))
+
+        @app.tool("late_tool", "Added after the core exists", {"type": "object"})
+        def late_tool():
+            return "result"
+
+        with patch("agentui.app.managed_bridge", fake_bridge), \
+                patch.object(core, "warm_up", AsyncMock()), \
+                patch.object(core, "run_loop", run_loop):
+            await app.run()
+
+        assert app._core is core
+        assert "late_tool" in seen["tools"]
+        assert seen["messages"] == []
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prompt", [None, "Hello"])
+    async def test_failed_warm_up_is_logged_not_raised(self, mock_api_key, caplog, prompt):
+        """Test that a warm-up error is logged the same way with or without a prompt."""
+        app = AgentApp(name="TestAgent")
+        bridge = MagicMock()
+        bridge.send_done = AsyncMock()
+
+        @asynccontextmanager
+        async def fake_bridge(*args, **kwargs):
+            yield bridge
+
+        async def process(message):
+            return
+            yield
+
+        async def run_loop():
+            await asyncio.sleep(0.01)  # let warm-up fail while the session runs
+
+        with patch("agentui.app.AgentCore") as MockCore, \
+                patch("agentui.app.managed_bridge", fake_bridge):
+            core = MockCore.return_value
+            core.warm_up = AsyncMock(side_effect=RuntimeError("warm-up bug"))
+            core.run_loop = run_loop
+            core.process_message = process
+
+            await app.run(prompt=prompt)
+
+        assert "warm-up bug" in caplog.text
+
 class TestCreateApp:
     """Tests for create_app convenience function."""
 
@@ -405,6 +598,13 @@ class TestCreateApp:
 class TestQuickChat:
     """Tests for quick_chat convenience function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_shared_providers(self):
+        """Keep providers shared by quick_chat from leaking between tests."""
+        clear_quick_chat_providers()
+        yield
+        clear_quick_chat_providers()
+
     @pytest.mark.asyncio
     async def test_quick_chat_basic(self, mock_api_key):
         """Test quick_chat creates app and returns response."""
@@ -440,3 +640,46 @@ class TestQuickChat:
             )
 
             assert response == "Response"
+
+    @pytest.mark.asyncio
+    async def test_quick_chat_shares_provider_not_history(self, mock_api_key):
+        """Test repeated quick_chat calls reuse the provider but start fresh."""
+        seen_messages = []
+
+        async def stream_message(messages, system=None, tools=None):
+            seen_messages.append(messages)
+            yield {"type": "text", "content": "Hi"}
+            yield {"type": "message_end"}
+
+        with patch("agentui.providers.claude.ClaudeProvider") as MockProvider:
+            MockProvider.return_value.stream_message = stream_message
+
+            assert await quick_chat("First") == "Hi"
+            assert await quick_chat("Second") == "Hi"
+
+            MockProvider.assert_called_once()
+
+        assert seen_messages == [
+            [{"role": "user", "content": "First"}],
+            [{"role": "user", "content": "Second"}],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_quick_chat_bounds_shared_providers(self, mock_api_key):
+        """Test the least recently used provider is dropped past the limit."""
+        async def stream_message(messages, system=None, tools=None):
+            yield {"type": "text", "content": "Hi"}
+            yield {"type": "message_end"}
+
+        with patch("agentui.providers.claude.ClaudeProvider") as MockProvider:
+            MockProvider.return_value.stream_message = stream_message
+
+            for i in range(QUICK_CHAT_PROVIDER_LIMIT + 1):
+                await quick_chat("Hello", model=f"model-{i}")
+
+        assert len(_QUICK_CHAT_PROVIDERS) == QUICK_CHAT_PROVIDER_LIMIT
+        models = [model for _, model, _ in _QUICK_CHAT_PROVIDERS]
+        assert "model-0" not in models
+
+        clear_quick_chat_providers()
+        assert not _QUICK_CHAT_PROVIDERS
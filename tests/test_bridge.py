@@ -4,7 +4,21 @@ Tests for the bridge module.
 
 import pytest
 import asyncio
-from agentui.bridge import CLIBridge, TUIConfig, create_bridge
+import gc
+import json
+import os
+import sys
+import threading
+from unittest.mock import AsyncMock, MagicMock
+from agentui.bridge import CLIBridge, TUIBridge, TUIConfig, create_bridge
+from agentui.bridge.cli_bridge import (
+    CODE_CACHE_SIZE,
+    TEXT_FLUSH_CHARS,
+    TEXT_FLUSH_DELAY,
+    _StdinReader,
+)
+from agentui.exceptions import ConnectionError, ProtocolError
+from agentui.primitives import checkbox_field, select_field, text_field
 from agentui.protocol import Message
 
 
@@ -24,6 +38,16 @@ def cli_bridge(cli_config):
     return CLIBridge(cli_config)
 
 
+@pytest.fixture
+def cli_stdin(cli_bridge):
+    """Point the CLI bridge's prompts at a pipe; yields its write end."""
+    read_fd, write_fd = os.pipe()
+    cli_bridge._stdin = _StdinReader(read_fd)
+    yield write_fd
+    os.close(write_fd)
+    os.close(read_fd)
+
+
 class TestCLIBridge:
     """Tests for CLIBridge."""
     
@@ -81,6 +105,602 @@ class TestCLIBridge:
         
         await cli_bridge.stop()
 
+    @pytest.mark.asyncio
+    async def test_send_text_coalesces_chunks(self, cli_bridge):
+        """Test that streamed chunks are written with a single print."""
+        cli_bridge._console = MagicMock()
+
+        await cli_bridge.send_text("Hel")
+        await cli_bridge.send_text("lo ")
+        await cli_bridge.send_text("World")
+        await asyncio.sleep(0)
+        assert cli_bridge._console.out.call_count == 0
+
+        await asyncio.sleep(TEXT_FLUSH_DELAY * 2)
+
+        cli_bridge._console.out.assert_called_once_with("Hello World", end="", highlight=False)
+
+    @pytest.mark.asyncio
+    async def test_send_text_flushes_at_size_threshold(self, cli_bridge):
+        """Test that a full buffer is printed without waiting for the timer."""
+        cli_bridge._console = MagicMock()
+        chunk = "x" * (TEXT_FLUSH_CHARS // 2)
+
+        await cli_bridge.send_text(chunk)
+        assert cli_bridge._console.out.call_count == 0
+        await cli_bridge.send_text(chunk)
+
+        cli_bridge._console.out.assert_called_once_with(chunk * 2, end="", highlight=False)
+        assert cli_bridge._flush_handle is None
+
+    @pytest.mark.asyncio
+    async def test_send_text_writes_through_at_line_end(self, cli_bridge):
+        """Test that a chunk ending a line is printed without waiting."""
+        cli_bridge._console = MagicMock()
+
+        await cli_bridge.send_text("first ")
+        await cli_bridge.send_text("line\n")
+
+        cli_bridge._console.out.assert_called_once_with("first line\n", end="", highlight=False)
+        assert cli_bridge._flush_handle is None
+
+    def test_send_text_printed_when_loop_ends_first(self, cli_config, capsys):
+        """Test that buffered text is not lost if the loop ends before the timer."""
+        bridge = CLIBridge(cli_config)
+
+        async def send():
+            await bridge.send_text("partial")  # no stop(), done or other output
+
+        asyncio.run(send())
+        del bridge
+        gc.collect()
+
+        assert "partial" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_send_text_prints_brackets_verbatim(self, cli_bridge):
+        """Test that streamed model text is not interpreted as Rich markup."""
+        import io
+
+        from rich.console import Console
+
+        cli_bridge._console = Console(file=io.StringIO(), force_terminal=False)
+
+        await cli_bridge.send_text("see [bold]docs[/bold] [1]", done=True)
+
+        assert cli_bridge._console.file.getvalue() == "see [bold]docs[/bold] [1]\n"
+
+    @pytest.mark.asyncio
+    async def test_send_code_reuses_highlighting(self, cli_bridge, monkeypatch):
+        """Test that a repeated code block is printed without re-lexing."""
+        import io
+
+        from rich.console import Console
+        from rich.syntax import Syntax
+
+        cli_bridge._console = Console(file=io.StringIO(), width=60)
+        highlights = []
+        highlight = Syntax.highlight
+        monkeypatch.setattr(
+            Syntax, "highlight", lambda *a, **k: highlights.append(1) or highlight(*a, **k)
+        )
+
+        await cli_bridge.send_code("x = 1\n", "python", title="repeat")
+        first = cli_bridge._console.file.getvalue()
+        await cli_bridge.send_code("x = 1\n", "python", title="repeat")
+
+        assert len(highlights) == 1
+        assert cli_bridge._console.file.getvalue() == first * 2
+        assert "x = 1" in first and "repeat" in first
+
+    @pytest.mark.asyncio
+    async def test_code_cache_is_bounded_per_bridge(self, cli_bridge):
+        """Test that rendered code is cached on the bridge, oldest dropped first."""
+        import io
+
+        from rich.console import Console
+
+        cli_bridge._console = Console(file=io.StringIO(), width=60)
+
+        for i in range(CODE_CACHE_SIZE + 1):
+            await cli_bridge.send_code(f"x = {i}\n", "python")
+
+        assert len(cli_bridge._code_cache) == CODE_CACHE_SIZE
+        assert ("x = 0\n", "python", None, 60) not in cli_bridge._code_cache
+        assert CLIBridge()._code_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_pending_text_flushed_before_other_output(self, cli_bridge):
+        """Test that buffered text is written before a following alert."""
+        cli_bridge._console = MagicMock()
+
+        await cli_bridge.send_text("partial")
+        await cli_bridge.send_alert("Heads up", severity="info")
+        await cli_bridge.send_text(" done", done=True)
+
+        printed = [str(c.args[0]) for c in cli_bridge._console.method_calls]
+        assert printed == ["partial", "Heads up", " done"]
+
+    @pytest.mark.asyncio
+    async def test_send_alert_prints_message_verbatim(self, cli_bridge):
+        """Test that alert text is styled by severity, not parsed as markup."""
+        cli_bridge._console = MagicMock()
+
+        await cli_bridge.send_alert("[x] 2 checks failed", severity="error", title="Lint")
+
+        title, message = (c.args[0] for c in cli_bridge._console.print.call_args_list)
+        assert (title.plain, str(title.style)) == ("Lint", "red bold")
+        assert (message.plain, str(message.style)) == ("[x] 2 checks failed", "red")
+
+    @pytest.mark.asyncio
+    async def test_request_form_accepts_primitives(self, cli_bridge, monkeypatch):
+        """Test that UIFormField objects and dicts can be mixed in a form."""
+        from rich.prompt import Confirm, Prompt
+
+        answers = iter(["Demo", "2"])
+        monkeypatch.setattr(Prompt, "ask", lambda *args, **kwargs: next(answers))
+        monkeypatch.setattr(Confirm, "ask", lambda *args, **kwargs: True)
+
+        await cli_bridge.start()
+        values = await cli_bridge.request_form(
+            fields=[
+                text_field("name", "Project Name"),
+                select_field("language", "Language", ["Python", "Go", "Rust"]),
+                {"name": "docker", "label": "Include Docker", "type": "checkbox"},
+            ],
+        )
+        await cli_bridge.stop()
+
+        assert values == {"name": "Demo", "language": "Go", "docker": True}
+
+
+    @pytest.mark.asyncio
+    async def test_prompt_does_not_block_event_loop(self, cli_bridge, cli_stdin, monkeypatch):
+        """Test that the loop keeps running while the user is typing."""
+        from rich.prompt import Prompt
+
+        typed = threading.Event()
+        monkeypatch.setattr(Prompt, "ask", lambda *args, **kwargs: typed.wait() and "hi")
+
+        await cli_bridge.start()
+        events = cli_bridge.events()
+        pending = asyncio.create_task(anext(events))
+        await asyncio.sleep(0.01)
+
+        assert not pending.done()  # still waiting, yet this test keeps running
+
+        typed.set()
+        event = await asyncio.wait_for(pending, timeout=1.0)
+        await events.aclose()
+        await cli_bridge.stop()
+
+        assert event.payload == {"content": "hi"}
+
+    @pytest.mark.asyncio
+    async def test_prompt_eof_quits(self, cli_bridge, monkeypatch):
+        """Test that EOF raised in the prompt thread still ends the session."""
+        from rich.prompt import Prompt
+
+        def closed_stdin(*args, **kwargs):
+            raise EOFError
+
+        monkeypatch.setattr(Prompt, "ask", closed_stdin)
+
+        await cli_bridge.start()
+        received = [event.type async for event in cli_bridge.events()]
+        await cli_bridge.stop()
+
+        assert received == ["quit"]
+
+    @pytest.mark.asyncio
+    async def test_ctrl_c_at_prompt_cancels_and_keeps_input(self, cli_bridge, cli_stdin):
+        """Test that Ctrl+C at the prompt cancels cleanly and leaves stdin unread."""
+        await cli_bridge.start()
+        events = cli_bridge.events()
+        pending = asyncio.create_task(anext(events))
+        await asyncio.sleep(0.05)
+
+        # asyncio.run() turns Ctrl+C into a cancel of the task awaiting input
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(pending, timeout=1.0)
+        await events.aclose()
+
+        # The abandoned prompt thread must not consume the next line
+        os.write(cli_stdin, b"hello\n")
+        events = cli_bridge.events()
+        event = await asyncio.wait_for(anext(events), timeout=1.0)
+        await events.aclose()
+        await cli_bridge.stop()
+
+        assert event.payload == {"content": "hello"}
+
+    def test_stdin_reader_splits_lines(self):
+        """Test that the stdin reader returns one line per call like input()."""
+        read_fd, write_fd = os.pipe()
+        wake_r, wake_w = os.pipe()
+        try:
+            os.write(write_fd, b"first\r\nsecond\nlast")
+            os.close(write_fd)
+            reader = _StdinReader(read_fd)
+
+            assert reader.readline(wake_r) == "first"
+            assert reader.readline(wake_r) == "second"
+            assert reader.readline(wake_r) == "last"
+            with pytest.raises(EOFError):
+                reader.readline(wake_r)
+        finally:
+            for fd in (read_fd, wake_r, wake_w):
+                os.close(fd)
+
+
+@pytest.fixture
+async def tui_bridge():
+    """Create a TUI bridge wired to a fake subprocess."""
+    bridge = TUIBridge(TUIConfig())
+    bridge._process = MagicMock()
+    bridge._process.stdin.drain = AsyncMock()
+    bridge._running = True
+    bridge._writer_task = asyncio.create_task(bridge._write_loop())
+    yield bridge
+    bridge._running = False
+    bridge._writer_task.cancel()
+
+
+def written_messages(bridge):
+    """Decode every JSON line written to the fake TUI stdin."""
+    lines = []
+    for call in bridge._process.stdin.write.call_args_list:
+        lines.extend(line for line in call.args[0].split(b"\n") if line)
+    return [json.loads(line) for line in lines]
+
+
+class TestTUIBridge:
+    """Tests for TUIBridge message writing."""
+
+    @pytest.mark.asyncio
+    async def test_send_writes_json_line(self, tui_bridge):
+        """Test that a queued message is written as one JSON line."""
+        await tui_bridge.send_text("Hello", done=True)
+        await asyncio.sleep(0.01)
+
+        assert written_messages(tui_bridge) == [
+            {"type": "text", "payload": {"content": "Hello", "done": True}}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_coalesces_writes(self, tui_bridge):
+        """Test that messages sent in a batch share a single write."""
+        async with tui_bridge.batch():
+            await tui_bridge.send_alert("One", severity="info")
+            await tui_bridge.send_alert("Two", severity="success")
+            await tui_bridge.send_alert("Three", severity="error")
+            await asyncio.sleep(0.01)
+            assert tui_bridge._process.stdin.write.call_count == 0
+
+        await asyncio.sleep(0.01)
+
+        assert tui_bridge._process.stdin.write.call_count == 1
+        messages = [m["payload"]["message"] for m in written_messages(tui_bridge)]
+        assert messages == ["One", "Two", "Three"]
+
+    @pytest.mark.asyncio
+    async def test_queued_messages_share_one_write(self, tui_bridge):
+        """Test that sends queued before the writer wakes are written together."""
+        for token in ("a", "b", "c"):
+            await tui_bridge.send_text(token)
+        await asyncio.sleep(0.01)
+
+        assert tui_bridge._process.stdin.write.call_count == 1
+        assert [m["payload"]["content"] for m in written_messages(tui_bridge)] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_full_outgoing_queue_applies_backpressure(self, tui_bridge):
+        """Test that send() waits for the writer once the queue is full."""
+        stdin_ready = asyncio.Event()
+        tui_bridge._process.stdin.drain = AsyncMock(side_effect=stdin_ready.wait)
+        tui_bridge._outgoing_queue = asyncio.Queue(maxsize=1)
+        tui_bridge._writer_task.cancel()
+        tui_bridge._writer_task = asyncio.create_task(tui_bridge._write_loop())
+
+        await tui_bridge.send_text("a")
+        await asyncio.sleep(0.01)  # writer takes "a" and blocks on drain
+        await tui_bridge.send_text("b")
+
+        pending = asyncio.create_task(tui_bridge.send_text("c"))
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+
+        stdin_ready.set()
+        await asyncio.wait_for(pending, timeout=1.0)
+        await asyncio.sleep(0.01)
+
+        assert [m["payload"]["content"] for m in written_messages(tui_bridge)] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_nested_batch_joins_outer(self, tui_bridge):
+        """Test that a nested batch is flushed with the outer one."""
+        async with tui_bridge.batch():
+            await tui_bridge.send_text("a")
+            async with tui_bridge.batch():
+                await tui_bridge.send_text("b")
+            await tui_bridge.send_text("c", done=True)
+
+        await asyncio.sleep(0.01)
+
+        assert tui_bridge._process.stdin.write.call_count == 1
+        assert [m["payload"]["content"] for m in written_messages(tui_bridge)] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_batch_ignores_other_tasks(self, tui_bridge):
+        """Test that a batch holds back only its own task's messages."""
+        in_batch = asyncio.Event()
+        release = asyncio.Event()
+
+        async def batched():
+            async with tui_bridge.batch():
+                await tui_bridge.send_text("batched")
+                in_batch.set()
+                await release.wait()
+
+        task = asyncio.create_task(batched())
+        await in_batch.wait()
+        await tui_bridge.send_status("Working")  # another task, mid-batch
+        await asyncio.sleep(0.01)
+
+        assert [m["type"] for m in written_messages(tui_bridge)] == ["status"]
+
+        release.set()
+        await task
+        await asyncio.sleep(0.01)
+
+        assert [m["type"] for m in written_messages(tui_bridge)] == ["status", "text"]
+
+    @pytest.mark.asyncio
+    async def test_batch_includes_tasks_started_inside(self, tui_bridge):
+        """Test that tasks started inside a batch join it."""
+        async with tui_bridge.batch(), asyncio.TaskGroup() as tg:
+            for token in ("a", "b"):
+                tg.create_task(tui_bridge.send_text(token))
+
+        await asyncio.sleep(0.01)
+
+        assert tui_bridge._process.stdin.write.call_count == 1
+        assert [m["payload"]["content"] for m in written_messages(tui_bridge)] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_stop_writes_queued_messages(self, tui_bridge):
+        """Test that stop() lets the writer drain the queue before exiting."""
+        process = tui_bridge._process
+        process.wait = AsyncMock(return_value=0)
+
+        await tui_bridge.send_text("Bye", done=True)
+        await tui_bridge.send_done()
+        await tui_bridge.stop()
+
+        tui_bridge._process = process
+        assert [m["type"] for m in written_messages(tui_bridge)] == ["text", "done"]
+        assert tui_bridge._writer_task.done()
+
+    @pytest.mark.asyncio
+    async def test_request_form_serializes_primitives(self, tui_bridge):
+        """Test that UIFormField objects are serialized at the transport boundary."""
+        tui_bridge.request = AsyncMock(return_value={"values": {"name": "Demo"}})
+
+        values = await tui_bridge.request_form(
+            fields=[
+                text_field("name", "Project Name"),
+                checkbox_field("docker", "Include Docker"),
+                {"name": "notes", "label": "Notes", "type": "textarea"},
+            ],
+            title="Project Setup",
+        )
+
+        assert values == {"name": "Demo"}
+        msg = tui_bridge.request.call_args.args[0]
+        assert msg.payload["fields"] == [
+            {"name": "name", "label": "Project Name", "type": "text"},
+            {"name": "docker", "label": "Include Docker", "type": "checkbox", "default": False},
+            {"name": "notes", "label": "Notes", "type": "textarea"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_events_yields_routed_messages(self, tui_bridge):
+        """Test that events() yields routed events in arrival order."""
+        for content in ("one", "two"):
+            await tui_bridge._route_message(
+                Message(type="input", payload={"content": content})
+            )
+        tui_bridge._close_events()
+
+        received = [event.payload["content"] async for event in tui_bridge.events()]
+
+        assert received == ["one", "two"]
+
+    @pytest.mark.asyncio
+    async def test_route_response_resolves_pending_request(self, tui_bridge):
+        """Test that responses resolve their request and others become events."""
+        future = asyncio.get_running_loop().create_future()
+        tui_bridge._pending_requests["req-1"] = future
+
+        await tui_bridge._route_message(
+            Message(type="confirm_response", id="req-1", payload={"confirmed": True})
+        )
+        await tui_bridge._route_message(Message(type="select_response", id="stale"))
+
+        assert future.result() == {"confirmed": True}
+        assert tui_bridge._pending_requests == {}
+        assert tui_bridge._event_queue.get_nowait().id == "stale"
+        assert tui_bridge._event_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_request_timeout_clears_pending(self, tui_bridge):
+        """Test that an unanswered request raises and forgets its future."""
+        msg = Message(type="confirm", id="req-1", payload={"title": "Sure?"})
+
+        with pytest.raises(ProtocolError, match="timed out"):
+            await tui_bridge.request(msg, timeout=0.01)
+
+        assert tui_bridge._pending_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_close_events_wakes_blocked_consumer(self, tui_bridge):
+        """Test that a consumer waiting on an empty queue exits on shutdown."""
+        async def consume():
+            return [event async for event in tui_bridge.events()]
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        assert not consumer.done()
+
+        tui_bridge._running = False
+        tui_bridge._close_events()
+
+        assert await asyncio.wait_for(consumer, timeout=1.0) == []
+
+    @pytest.mark.asyncio
+    async def test_unread_events_do_not_block_responses(self, tui_bridge):
+        """Test that a reply still resolves while events() is not being drained."""
+        future = asyncio.get_running_loop().create_future()
+        tui_bridge._pending_requests["req-1"] = future
+
+        for width in range(200):
+            await asyncio.wait_for(
+                tui_bridge._route_message(Message(type="resize", payload={"width": width})),
+                timeout=1.0,
+            )
+        await asyncio.wait_for(
+            tui_bridge._route_message(
+                Message(type="confirm_response", id="req-1", payload={"confirmed": True})
+            ),
+            timeout=1.0,
+        )
+
+        assert future.result() == {"confirmed": True}
+        assert tui_bridge._event_queue.qsize() == 200
+
+
+FAKE_TUI = """\
+import json
+import os
+import sys
+
+print(json.dumps({"type": "input", "payload": {"content": "hello"}}), flush=True)
+for line in sys.stdin:
+    msg = json.loads(line)
+    if msg.get("id"):
+        reply = {"type": "confirm", "id": msg["id"], "payload": {"confirmed": True}}
+        print(json.dumps(reply), flush=True)
+"""
+
+
+@pytest.fixture
+def fake_tui(tmp_path):
+    """Write an executable stand-in for the Go TUI binary."""
+    script = tmp_path / "agentui-tui"
+    script.write_text(f"#!{sys.executable}\n{FAKE_TUI}")
+    script.chmod(0o755)
+    return script
+
+
+class TestTUIBridgeProcess:
+    """Tests for TUIBridge against a real subprocess."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_over_pipes(self, fake_tui):
+        """Test events and request replies travel over the async pipes."""
+        bridge = TUIBridge(TUIConfig(tui_path=str(fake_tui)))
+        await bridge.start()
+        try:
+            event = await asyncio.wait_for(anext(bridge.events()), timeout=5.0)
+            assert event.payload == {"content": "hello"}
+
+            confirmed = await asyncio.wait_for(
+                bridge.request_confirm("Proceed?"), timeout=5.0
+            )
+            assert confirmed is True
+        finally:
+            await bridge.stop()
+
+        assert bridge._process is None
+
+    @pytest.mark.asyncio
+    async def test_reconnect_replaces_writer(self, fake_tui):
+        """Test that a reconnect leaves exactly one writer on the outgoing queue."""
+        bridge = TUIBridge(TUIConfig(tui_path=str(fake_tui), reconnect_delay=0))
+        await bridge.start()
+        try:
+            old_process, old_writer = bridge._process, bridge._writer_task
+            old_process.kill()
+
+            async def reconnected():
+                while bridge._process is old_process:
+                    await asyncio.sleep(0.01)
+
+            await asyncio.wait_for(reconnected(), timeout=5.0)
+
+            assert old_writer.done()
+            assert bridge._writer_task is not old_writer
+            confirmed = await asyncio.wait_for(
+                bridge.request_confirm("Still there?"), timeout=5.0
+            )
+            assert confirmed is True
+        finally:
+            await bridge.stop()
+
+    @pytest.mark.asyncio
+    async def test_oversized_line_is_skipped(self, tmp_path, monkeypatch):
+        """Test that a line over LINE_LIMIT is dropped and reading continues."""
+        script = tmp_path / "agentui-tui"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import json\n"
+            "print(json.dumps({'type': 'input', 'payload': {'content': 'x' * 200_000}}))\n"
+            "print(json.dumps({'type': 'input', 'payload': {'content': 'after'}}))\n"
+            "input()\n"
+        )
+        script.chmod(0o755)
+        monkeypatch.setattr("agentui.bridge.tui_bridge.LINE_LIMIT", 1024)
+
+        bridge = TUIBridge(TUIConfig(tui_path=str(script)))
+        await bridge.start()
+        try:
+            event = await asyncio.wait_for(anext(bridge.events()), timeout=5.0)
+            assert event.payload == {"content": "after"}
+            assert not bridge._reader_task.done()
+        finally:
+            await bridge.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_start_launches_once(self, fake_tui, monkeypatch):
+        """Test that overlapping start() calls share one subprocess."""
+        launches = []
+        create = asyncio.create_subprocess_exec
+
+        async def counting_create(*args, **kwargs):
+            launches.append(args)
+            return await create(*args, **kwargs)
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", counting_create)
+
+        bridge = TUIBridge(TUIConfig(tui_path=str(fake_tui)))
+        await asyncio.gather(bridge.start(), bridge.start())
+        await bridge.stop()
+
+        assert len(launches) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_start_can_be_retried(self, tmp_path):
+        """Test that a launch failure leaves the bridge stopped."""
+        broken = tmp_path / "agentui-tui"
+        broken.write_text("not executable")
+
+        bridge = TUIBridge(TUIConfig(tui_path=str(broken)))
+        with pytest.raises(ConnectionError):
+            await bridge.start()
+
+        assert not bridge.is_running
+
 
 class TestCreateBridge:
     """Tests for create_bridge function."""
@@ -103,6 +723,21 @@ class TestCreateBridge:
         with pytest.raises(FileNotFoundError):
             create_bridge(config, fallback=False)
 
+    def test_binary_lookup_is_cached(self, tmp_path):
+        """Test that a found binary is reused and a missing one is retried."""
+        binary = tmp_path / "agentui-tui"
+        config = TUIConfig(tui_path=str(binary))
+
+        with pytest.raises(FileNotFoundError):
+            create_bridge(config, fallback=False)
+
+        binary.touch()
+        bridge = create_bridge(config, fallback=False)
+        assert isinstance(bridge, TUIBridge)
+
+        binary.unlink()
+        assert bridge._find_tui_binary() == str(binary)
+
 
 class TestTUIConfig:
     """Tests for TUIConfig."""
@@ -128,6 +128,61 @@ class TestToolRegistration:
         assert "simple_tool" in tool_names
         assert "display_table" in tool_names
 
+    def test_register_tools_refreshes_schemas(self):
+        """Test bulk registration and that cached schemas pick it up."""
+        core = AgentCore()
+        before = core.get_tool_schemas()
+        assert core.get_tool_schemas() is before
+
+        tools = [
+            ToolDefinition(
+                name=name,
+                description=name,
+                parameters={"type": "object", "properties": {}},
+                handler=lambda: "result",
+            )
+            for name in ("first_tool", "second_tool")
+        ]
+        core.register_tools(tools)
+
+        tool_names = [s["name"] for s in core.get_tool_schemas()]
+        assert len(tool_names) == len(before) + 2
+        assert "first_tool" in tool_names
+        assert "second_tool" in tool_names
+
+    def test_unregister_tool_refreshes_schemas(self):
+        """Test removing a tool drops it from the cached schemas."""
+        core = AgentCore()
+        before = core.get_tool_schemas()
+        assert isinstance(before, tuple)
+
+        core.unregister_tool("display_table")
+
+        assert "display_table" not in core.tools
+        tool_names = [s["name"] for s in core.get_tool_schemas()]
+        assert "display_table" not in tool_names
+        assert len(tool_names) == len(before) - 1
+
+        with pytest.raises(KeyError):
+            core.unregister_tool("display_table")
+
+    def test_tools_mapping_writes_refresh_schemas(self):
+        """Test that writing to core.tools still works and updates the schemas."""
+        core = AgentCore()
+        core.get_tool_schemas()
+
+        core.tools["extra_tool"] = ToolDefinition(
+            name="extra_tool",
+            description="Extra",
+            parameters={"type": "object", "properties": {}},
+            handler=lambda: "result",
+        )
+        del core.tools["display_table"]
+
+        tool_names = [s["name"] for s in core.get_tool_schemas()]
+        assert "extra_tool" in tool_names
+        assert "display_table" not in tool_names
+
 
 class TestToolExecution:
     """Test tool execution."""
@@ -499,6 +554,15 @@ class TestDisplayTools:
 
         mock_bridge.request_select.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_unknown_display_type(self, mock_bridge):
+        """Test that an unmapped display type is reported, not sent."""
+        core = AgentCore(bridge=mock_bridge)
+
+        result = await core.display_tools._execute_display_message("chart", {})
+
+        assert result == "Unknown display type: chart"
+
 
 class TestUIResultHandling:
     """Test handle_ui_result method."""
@@ -779,6 +843,77 @@ class TestProviderManagement:
             MockProvider.assert_called_once()
             assert provider1 == provider2
 
+    @pytest.mark.asyncio
+    async def test_set_provider_skips_creation(self):
+        """Test an injected provider is used instead of one built from config."""
+        core = AgentCore()
+        shared = MagicMock()
+
+        with patch("agentui.providers.claude.ClaudeProvider") as MockProvider:
+            core.set_provider(shared)
+
+            assert core.provider is shared
+            assert await core._get_provider() is shared
+            MockProvider.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_builds_client(self):
+        """Test warm_up() creates the provider and warms its client."""
+        from agentui.types import ProviderType
+
+        config = AgentConfig(provider=ProviderType.CLAUDE, api_key="test-key")
+        core = AgentCore(config=config)
+
+        with patch("agentui.providers.claude.ClaudeProvider") as MockProvider:
+            mock_instance = MagicMock()
+            mock_instance.warm_up = AsyncMock()
+            MockProvider.return_value = mock_instance
+
+            await core.warm_up()
+
+            mock_instance.warm_up.assert_awaited_once()
+            assert await core._get_provider() is mock_instance
+
+    @pytest.mark.asyncio
+    async def test_warm_up_logs_provider_errors(self, caplog):
+        """Test warm_up() logs setup errors and leaves them to process_message()."""
+        from agentui.exceptions import ProviderError
+        from agentui.types import ProviderType
+
+        config = AgentConfig(provider=ProviderType.CLAUDE, api_key=None)
+        core = AgentCore(config=config)
+
+        with patch("agentui.providers.claude.ClaudeProvider") as MockProvider:
+            MockProvider.return_value.warm_up = AsyncMock(
+                side_effect=ProviderError("Anthropic API key not found")
+            )
+
+            await core.warm_up()
+
+        assert "Anthropic API key not found" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_warm_up_propagates_unexpected_errors(self):
+        """Test warm_up() does not hide bugs behind the expected errors."""
+        from agentui.types import ProviderType
+
+        config = AgentConfig(provider=ProviderType.CLAUDE, api_key="test-key")
+        core = AgentCore(config=config)
+
+        with patch("agentui.providers.claude.ClaudeProvider") as MockProvider:
+            MockProvider.return_value.warm_up = AsyncMock(side_effect=RuntimeError("bug"))
+
+            with pytest.raises(RuntimeError, match="bug"):
+                await core.warm_up()
+
+
+    @pytest.mark.asyncio
+    async def test_warm_up_skips_provider_without_hook(self):
+        """Test warm_up() accepts a provider given to set_provider() without warm_up()."""
+        core = AgentCore()
+        core.set_provider(object())
+
+        await core.warm_up()
 
 class TestToolIntegration:
     """Test tool integration scenarios."""
@@ -2,6 +2,8 @@
 Tests for the primitives module.
 """
 
+import json
+
 import pytest
 from agentui.primitives import (
     UIForm,
@@ -17,6 +19,7 @@ from agentui.primitives import (
     checkbox_field,
     number_field,
 )
+from agentui.protocol import MessageType, create_message
 
 
 def test_form_field_to_dict():
@@ -105,6 +108,20 @@ def test_table_to_dict():
     assert d["footer"] == "Total: 6"
 
 
+def test_table_to_dict_keeps_tuple_rows():
+    """Test that tuple rows are passed through without copying."""
+    rows = (("1", "2"), ("3", "4"))
+    table = UITable(columns=("A", "B"), rows=rows)
+
+    d = table.to_dict()
+
+    assert d["rows"] is rows
+    assert json.loads(create_message(MessageType.TABLE, d).to_json())["payload"]["rows"] == [
+        ["1", "2"],
+        ["3", "4"],
+    ]
+
+
 def test_code_to_dict():
     """Test code block serialization."""
     code = UICode(
@@ -11,6 +11,7 @@ from agentui.protocol import (
     create_request,
     form_field,
     form_payload,
+    markdown_payload,
     table_payload,
     code_payload,
     text_payload,
@@ -37,6 +38,51 @@ def test_message_from_json():
     assert msg.payload["content"] == "Hello"
 
 
+def test_message_json_round_trip():
+    """Test that id, nested payloads and non-ASCII text survive a round trip."""
+    msg = create_message(
+        MessageType.TABLE,
+        table_payload(["Name"], [("Zoë ✓",)], title="Résumé"),
+        msg_id="abc",
+    )
+
+    decoded = Message.from_json(msg.to_json())
+
+    assert decoded.type == "table"
+    assert decoded.id == "abc"
+    assert decoded.payload == {"columns": ["Name"], "rows": [["Zoë ✓"]], "title": "Résumé"}
+
+
+def test_message_to_json_is_compact():
+    """Test that frames carry no separator padding."""
+    msg = create_message(MessageType.TEXT, text_payload("Hi", done=True))
+
+    assert msg.to_json() == '{"type":"text","payload":{"content":"Hi","done":true}}'
+
+
+def test_message_to_bytes_matches_to_json():
+    """Test that the pipe encoding is the UTF-8 form of the JSON line."""
+    msg = create_message(MessageType.MARKDOWN, markdown_payload("Zoë ✓"), msg_id="m1")
+
+    assert msg.to_bytes() == msg.to_json().encode()
+
+
+def test_message_from_invalid_json():
+    """Test that malformed lines raise JSONDecodeError with either backend."""
+    with pytest.raises(json.JSONDecodeError):
+        Message.from_json('{"type": "input", ')
+
+
+def test_message_from_json_bytes():
+    """Test that raw pipe bytes decode like the equivalent text line."""
+    line = '{"type":"input","id":"r1","payload":{"content":"Zoë"}}'
+
+    assert Message.from_json(line.encode()) == Message.from_json(line)
+
+    with pytest.raises(json.JSONDecodeError):
+        Message.from_json(b'{"type": "input", "payload": "\xff"}')
+
+
 def test_create_request_has_id():
     """Test that requests have auto-generated IDs."""
     msg = create_request(MessageType.FORM, form_payload([]))
@@ -112,6 +112,18 @@ class TestClaudeProviderClient:
                 with pytest.raises(ImportError, match="anthropic package not installed"):
                     provider._get_client()
 
+    @pytest.mark.asyncio
+    async def test_warm_up_creates_client(self):
+        """Test warm_up() builds the client used by later requests."""
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            provider = ClaudeProvider()
+
+            mock_anthropic_module = MagicMock()
+            with patch.dict("sys.modules", {"anthropic": mock_anthropic_module}):
+                await provider.warm_up()
+
+                assert provider._client is mock_anthropic_module.Anthropic.return_value
+
 
 class TestClaudeProviderMessageConversion:
     """Test Claude provider message conversion."""
@@ -200,6 +212,28 @@ class TestClaudeProviderMessageConversion:
                 }
             ]
 
+    def test_convert_tools_reuses_result(self):
+        """Test conversion is cached per schema tuple."""
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            provider = ClaudeProvider()
+
+            tools = ({"name": "a", "description": "A", "input_schema": {"type": "object"}},)
+
+            first = provider._convert_tools(tools)
+            assert provider._convert_tools(tools) is first
+            assert provider._convert_tools(tuple(list(tools))) is not first
+
+    def test_convert_tools_sees_list_changes(self):
+        """Test a schema list changed in place is not served from the cache."""
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            provider = ClaudeProvider()
+
+            tools = [{"name": "a", "description": "A", "input_schema": {"type": "object"}}]
+            assert len(provider._convert_tools(tools)) == 1
+
+            tools.append({"name": "b", "description": "B", "input_schema": {"type": "object"}})
+            assert len(provider._convert_tools(tools)) == 2
+
 
 class TestClaudeProviderStreaming:
     """Test Claude provider streaming."""
@@ -550,6 +584,16 @@ class TestOpenAIProviderClient:
                 with pytest.raises(ImportError, match="openai package not installed"):
                     provider._get_client()
 
+    @pytest.mark.asyncio
+    async def test_warm_up_raises_configuration_errors(self):
+        """Test warm_up() reports a missing API key to the caller."""
+        with patch.dict("os.environ", {}, clear=True):
+            provider = OpenAIProvider()
+
+            with patch.dict("sys.modules", {"openai": MagicMock()}):
+                with pytest.raises(ProviderError, match="OpenAI API key not found"):
+                    await provider.warm_up()
+
 
 class TestOpenAIProviderMessageConversion:
     """Test OpenAI provider message conversion."""
@@ -655,6 +699,28 @@ class TestOpenAIProviderMessageConversion:
             assert result[0]["function"]["description"] == "Get weather data"
             assert result[0]["function"]["parameters"]["properties"]["city"]["type"] == "string"
 
+    def test_convert_tools_reuses_result(self):
+        """Test conversion is cached per schema tuple."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            provider = OpenAIProvider()
+
+            tools = ({"name": "a", "description": "A", "input_schema": {"type": "object"}},)
+
+            first = provider._convert_tools(tools)
+            assert provider._convert_tools(tools) is first
+            assert provider._convert_tools(tuple(list(tools))) is not first
+
+    def test_convert_tools_sees_list_changes(self):
+        """Test a schema list changed in place is not served from the cache."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            provider = OpenAIProvider()
+
+            tools = [{"name": "a", "description": "A", "input_schema": {"type": "object"}}]
+            assert len(provider._convert_tools(tools)) == 1
+
+            tools.append({"name": "b", "description": "B", "input_schema": {"type": "object"}})
+            assert len(provider._convert_tools(tools)) == 2
+
 
 class TestOpenAIProviderStreaming:
     """Test OpenAI provider streaming."""